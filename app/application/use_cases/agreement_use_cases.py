@@ -161,10 +161,10 @@ class AgreementUseCases(LoggerMixin):
                     supplier_name=product.supplier_name,
                     supplier_ruc=product.supplier_ruc,
                     active=product.active,
-                    created_at=product.created_at.isoformat() if product.created_at else None,
+                    created_at=product.created_at,
                     created_by_user_email=product.created_by_user_email,
                     updated_status_by_user_email=product.updated_status_by_user_email,
-                    updated_at=product.updated_at.isoformat() if product.updated_at else None
+                    updated_at=product.updated_at
                 )
                 for product in products
             ]
@@ -191,16 +191,16 @@ class AgreementUseCases(LoggerMixin):
                     agreement_id=excluded_flag.agreement_id,
                     excluded_flag_id=excluded_flag.excluded_flag_id,
                     active=excluded_flag.active,
-                    created_at=excluded_flag.created_at.isoformat() if excluded_flag.created_at else None,
+                    created_at=excluded_flag.created_at,
                     created_by_user_email=excluded_flag.created_by_user_email,
-                    updated_at=excluded_flag.updated_at.isoformat() if excluded_flag.updated_at else None,
+                    updated_at=excluded_flag.updated_at,
                     updated_status_by_user_email=excluded_flag.updated_status_by_user_email,
                     excluded_flag_name=excluded_flag.excluded_flag_name
                 )
                 for excluded_flag in excluded_flags
             ]
             
-            response = AgreementResponse(
+            response = AgreementResponse.build_trusted(
                 id=agreement.id,
                 business_unit_id=agreement.business_unit_id,
                 agreement_number=agreement.agreement_number,
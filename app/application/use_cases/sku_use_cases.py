@@ -1,5 +1,4 @@
 from typing import List
-from app.interfaces.schemas.sku_schema import SkuCodesRequest
 from app.domain.entities.sku import Sku
 from app.domain.repositories.sku_repository import SkuRepository
 from app.core.logging import LoggerMixin
@@ -14,19 +13,19 @@ class SkuUseCases(LoggerMixin):
             repository_type=type(sku_repository).__name__
         )
 
-    async def get_skus_by_codes(self, sku_request: SkuCodesRequest) -> List[Sku]:
+    async def get_skus_by_codes(self, sku_codes: List[str]) -> List[Sku]:
         try:
             self.log_info(
                 "Obteniendo SKUs por códigos",
-                sku_codes_count=len(sku_request.sku_codes),
-                sku_codes=sku_request.sku_codes[:5]
+                sku_codes_count=len(sku_codes),
+                sku_codes=sku_codes[:5]
             )
             
-            unique_codes = list(set(sku_request.sku_codes))
-            if len(unique_codes) != len(sku_request.sku_codes):
+            unique_codes = list(set(sku_codes))
+            if len(unique_codes) != len(sku_codes):
                 self.log_warning(
                     "Se encontraron códigos SKU duplicados, eliminando duplicados",
-                    original_count=len(sku_request.sku_codes),
+                    original_count=len(sku_codes),
                     unique_count=len(unique_codes)
                 )
             
@@ -44,7 +43,7 @@ class SkuUseCases(LoggerMixin):
             self.log_error(
                 "Error de validación al obtener SKUs",
                 error=e,
-                sku_codes=sku_request.sku_codes
+                sku_codes=sku_codes
             )
             raise
             
@@ -52,6 +51,6 @@ class SkuUseCases(LoggerMixin):
             self.log_error(
                 "Error inesperado al obtener SKUs",
                 error=e,
-                sku_codes=sku_request.sku_codes
+                sku_codes=sku_codes
             )
             raise ValueError(f"Error al obtener SKUs: {str(e)}")
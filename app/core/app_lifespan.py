@@ -4,6 +4,27 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Dict, Any
 from app.core.logging import LoggerMixin
 from app.infrastructure.postgres.session import check_async_database_connection
+from app.interfaces.schemas.agreement_excluded_flag_schema import (
+    AgreementExcludedFlagCreateRequest,
+    AgreementExcludedFlagCreateResponse,
+    AgreementExcludedFlagResponse,
+)
+from app.interfaces.schemas.agreement_product_schema import (
+    AgreementProductCreateRequest,
+    AgreementProductCreateResponse,
+    AgreementProductResponse,
+)
+
+# Modelos con defer_build que usan los endpoints; el resto de schemas diferidos
+# (bases, mixins, carga masiva) se construye solo si alguien los usa
+_DEFERRED_SCHEMAS = (
+    AgreementProductCreateRequest,
+    AgreementProductResponse,
+    AgreementProductCreateResponse,
+    AgreementExcludedFlagCreateRequest,
+    AgreementExcludedFlagResponse,
+    AgreementExcludedFlagCreateResponse,
+)
 
 class AppLifecycle(LoggerMixin):
     """Application lifecycle manager with logging capabilities."""
@@ -46,6 +67,11 @@ class AppLifecycle(LoggerMixin):
     async def _startup_events(self, app: FastAPI) -> None:
         """Handle application startup events."""
         try:
+            # Construir ahora los schemas diferidos (defer_build), no en el primer request
+            self._build_deferred_schemas()
+            # FastAPI cachea el documento: /openapi.json ya no lo genera en la primera visita
+            app.openapi()
+
             # Database connection check
             self.log_info("🔍 Checking database connection...")
 
@@ -60,6 +86,12 @@ class AppLifecycle(LoggerMixin):
             self.log_error("❌ Startup events failed", error=e)
             raise
 
+    def _build_deferred_schemas(self) -> None:
+        """Build the request-path pydantic models that deferred their build."""
+        for model in _DEFERRED_SCHEMAS:
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+
     async def _shutdown_events(self, app: FastAPI) -> None:
         """Handle application shutdown events."""
         try:
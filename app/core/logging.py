@@ -164,6 +164,11 @@ class LoggerMixin:
     def logger(self) -> logging.Logger:
         return get_logger(self.__class__.__name__)
     
+    @property
+    def info_enabled(self) -> bool:
+        """Whether INFO records would be emitted (lets hot paths skip building log kwargs)."""
+        return self.logger.isEnabledFor(logging.INFO)
+    
     def log_info(self, message: str, **kwargs: Any) -> None:
         """Log info message with extra fields."""
         self.logger.info(message, extra=kwargs)
@@ -1,21 +1,27 @@
 """Middleware package for API interfaces."""
 
 # Import all middleware functions for easy access
-from .request_logging import request_logging_middleware
+from .request_logging import RequestLoggingMiddleware
 from .error_handlers import (
     validation_exception_handler,
     http_exception_handler,
     general_exception_handler
 )
 from .auth_middleware import AuthMiddleware
+from .db_session import DbSessionMiddleware
 
 __all__ = [
-    # Basic middleware functions
-    "request_logging_middleware",
+    # Request logging middleware
+    "RequestLoggingMiddleware",
+
+    # Exception handlers
     "validation_exception_handler",
     "http_exception_handler", 
     "general_exception_handler",
     
     # Authentication middleware
-    "AuthMiddleware"
+    "AuthMiddleware",
+
+    # Database session middleware
+    "DbSessionMiddleware",
 ]
@@ -1,68 +1,104 @@
 """Authentication middleware for FastAPI application."""
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.interfaces.dependencies.auth_dependencies import security
 import logging
-from starlette.responses import PlainTextResponse
 
 logger = logging.getLogger(__name__)
 
+# Nombres de header en bytes (ASGI los entrega en minúsculas)
+_COUNTRY_KEY = b"country"
+_AUTHORIZATION_KEY = b"authorization"
+_PREFLIGHT_KEY = b"access-control-request-method"
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, exclude_paths: list[str] = None):
-        super().__init__(app)
+
+class AuthMiddleware:
+    """Pure ASGI authentication middleware.
+
+    Validates the ``country`` and ``Authorization`` headers and stores the
+    authenticated user in ``request.state.user``.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: list[str] = None):
+        self.app = app
         self.exclude_paths = exclude_paths or [
             "/docs", "/redoc", "/openapi.json", "/health", "/", "/favicon.ico"
             # Removed "/api/v1/clients" - let it authenticate normally
         ]
-    
-    async def dispatch(self, request: Request, call_next):
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip authentication for excluded paths
-        path = request.url.path
+        path = scope["path"]
         logger.info(f"Processing path: {path}")
 
+        # Single pass over the raw ASGI headers (first occurrence wins)
+        country = authorization = None
+        preflight = False
+        for name, value in scope["headers"]:
+            if name == _COUNTRY_KEY:
+                if country is None:
+                    country = value
+            elif name == _AUTHORIZATION_KEY:
+                if authorization is None:
+                    authorization = value
+            elif name == _PREFLIGHT_KEY:
+                preflight = True
+
         # Bypass preflight OPTIONS
-        if request.method == "OPTIONS" or "access-control-request-method" in request.headers:
+        if scope["method"] == "OPTIONS" or preflight:
             logger.info("Skipping auth for CORS preflight")
-            # return PlainTextResponse("", status_code=204)
-            return await call_next(request)
-        
+            await self.app(scope, receive, send)
+            return
+
         # Check if path exactly matches excluded paths or is a health endpoint
         if path in self.exclude_paths:
             logger.info(f"Skipping authentication for excluded path: {path}")
-            return await call_next(request)
-        
-        # Extract headers - try both standard and lowercase
-        country = request.headers.get("country")
-        authorization = request.headers.get("Authorization") or request.headers.get("authorization")
-        
+            await self.app(scope, receive, send)
+            return
+
+        # Decode only what is needed (latin-1 is the HTTP header charset)
+        country = country.decode("latin-1") if country else None
+        authorization = authorization.decode("latin-1") if authorization is not None else None
+
         logger.info(f"Country header: {country}, Authorization header present: {authorization is not None}")
-        
+
         if not country:
-            raise HTTPException(status_code=422, detail="Missing country header")
-        
+            response = JSONResponse(
+                status_code=422,
+                content={"detail": "Missing country header"}
+            )
+            await response(scope, receive, send)
+            return
+
         try:
             # Use your existing security function
             logger.info("Calling security function...")
             user = await security(country, authorization)
             logger.info(f"User authenticated: {user.email if user else 'None'}")
-            request.state.user = user
+            scope.setdefault("state", {})["user"] = user
         except HTTPException as e:
             logger.error(f"HTTPException in security: {e.status_code}: {e.detail}")
             # Return a proper HTTP response instead of re-raising
-            from fastapi.responses import JSONResponse
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=e.status_code,
                 content={"detail": e.detail}
             )
+            await response(scope, receive, send)
+            return
         except Exception as e:
             logger.error(f"Exception in security: {str(e)}", exc_info=True)
             # Return a proper HTTP response for unexpected errors
-            from fastapi.responses import JSONResponse
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": f"Authentication failed: {str(e)}"}
             )
-        
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
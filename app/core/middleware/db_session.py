@@ -0,0 +1,57 @@
+"""Database session middleware (pure ASGI)."""
+
+from typing import Iterable, List, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.postgres.session import AsyncSessionLocal
+
+
+class DbSessionMiddleware:
+    """Own one AsyncSession per HTTP request.
+
+    The session is exposed as ``request.state.db_session`` for the repository
+    dependencies. The response messages are held back until the application
+    returns (body sent, background tasks done); only then is the session
+    committed, for statuses below 400, or rolled back, and the response is
+    released to the client. A failure at any point, including a failed commit,
+    rolls back and propagates before the client has seen a status line. Every
+    method, reads included, runs in a regular transaction. Paths in
+    ``exclude_paths`` (health checks, docs) never touch the database and get no
+    session.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Optional[Iterable[str]] = None) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths or ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        async with AsyncSessionLocal() as session:
+            scope.setdefault("state", {})["db_session"] = session
+            # Las respuestas de la API son JSON de un solo cuerpo: retenerlas hasta el commit
+            # no cambia el streaming y evita confirmar escrituras que luego fallen
+            messages: List[Message] = []
+
+            async def buffer_send(message: Message) -> None:
+                messages.append(message)
+
+            try:
+                await self.app(scope, receive, buffer_send)
+                start = next(
+                    (message for message in messages if message["type"] == "http.response.start"),
+                    None,
+                )
+                if start is not None and start["status"] < 400:
+                    await session.commit()
+                else:
+                    await session.rollback()
+            except Exception:
+                await session.rollback()
+                raise
+
+            for message in messages:
+                await send(message)
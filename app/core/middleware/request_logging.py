@@ -4,18 +4,25 @@ import time
 from typing import Any, Dict
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import LoggerMixin
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware, LoggerMixin):
-    """Middleware to log all requests and responses with detailed information."""
+class RequestLoggingMiddleware(LoggerMixin):
+    """Pure ASGI middleware to log all requests and responses with detailed information."""
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with comprehensive logging."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         start_time = time.time()
+        request = Request(scope)
         
         # Extract request information
         request_info = self._extract_request_info(request)
@@ -26,25 +33,26 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware, LoggerMixin):
             **request_info
         )
         
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time in milliseconds
+                process_time = round((time.time() - start_time) * 1000, 2)
+                
+                # Log successful response with clean fields
+                self.log_info(
+                    "Request completed successfully",
+                    endpoint=request_info["endpoint"],
+                    method=request_info["method"],
+                    client_ip=request_info["client_ip"],
+                    status_code=message["status"],
+                    process_time=process_time,
+                    country=request.headers.get("country")
+                )
+            await send(message)
+        
         try:
             # Process request
-            response = await call_next(request)
-            
-            # Calculate processing time in milliseconds
-            process_time = round((time.time() - start_time) * 1000, 2)
-            
-            # Log successful response with clean fields
-            self.log_info(
-                "Request completed successfully",
-                endpoint=request_info["endpoint"],
-                method=request_info["method"],
-                client_ip=request_info["client_ip"],
-                status_code=response.status_code,
-                process_time=process_time,
-                country=request.headers.get("country")
-            )
-            
-            return response
+            await self.app(scope, receive, send_wrapper)
             
         except Exception as e:
             # Calculate processing time in milliseconds
@@ -129,13 +137,6 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware, LoggerMixin):
 
 
 # Factory function for creating request logging middleware
-def create_request_logging_middleware(app) -> RequestLoggingMiddleware:
+def create_request_logging_middleware(app: ASGIApp) -> RequestLoggingMiddleware:
     """Create and configure request logging middleware."""
     return RequestLoggingMiddleware(app)
-
-
-# Convenience function for direct usage
-async def request_logging_middleware(request: Request, call_next):
-    """Request logging middleware function for direct usage."""
-    middleware = RequestLoggingMiddleware(None)
-    return await middleware.dispatch(request, call_next)
@@ -1,6 +1,12 @@
 """Business utility functions for domain layer."""
 
-from typing import Optional
+from typing import Dict, Optional
+
+# Business unit ID por país (construido una sola vez, no en cada llamada)
+_BU_ID_BY_COUNTRY: Dict[str, int] = {
+    'CL': 4,
+    'PE': 5
+}
 
 
 def get_bu_id(country: str) -> Optional[int]:
@@ -13,8 +19,4 @@ def get_bu_id(country: str) -> Optional[int]:
     Returns:
         Business unit ID or None if country not supported
     """
-    bu_mapping = {
-        'CL': 4,
-        'PE': 5
-    }
-    return bu_mapping.get(country)
+    return _BU_ID_BY_COUNTRY.get(country)
@@ -1,13 +1,76 @@
 """Unified validator combining all validation functionalities."""
 
 import re
+import string
 import time
 import unicodedata
-from typing import List, Optional, Any
+from functools import lru_cache
+from typing import Collection, List, Optional, Any, Pattern, Union
 from dataclasses import dataclass
 
 import bleach
 
+# Nombres genéricos que la capa de negocio marca como advertencia (un solo set compartido)
+GENERIC_NAMES = frozenset({'test', 'admin', 'root', 'user', 'demo', 'example', 'sample'})
+
+# Caracteres que no pueden formar marcado HTML, operadores NoSQL, rutas ni caracteres de control
+_PLAIN_CHARS = frozenset(string.ascii_letters + string.digits + " -_")
+
+
+def _is_plain(value: str) -> bool:
+    """Whether ``value`` only has ASCII letters, digits, spaces, '-' and '_'."""
+    # isascii/isalnum son chequeos en C que resuelven el caso típico (códigos alfanuméricos)
+    return value.isascii() and (value.isalnum() or _PLAIN_CHARS.issuperset(value))
+
+
+def _match_pattern(pattern: Union[str, Pattern[str]], value: str) -> Optional[re.Match]:
+    """Match ``value`` against a regex string or a precompiled pattern."""
+    if isinstance(pattern, str):
+        return re.match(pattern, value)
+    return pattern.match(value)
+
+
+# Patrones de seguridad compilados una sola vez al importar
+_SQL_PATTERNS = (
+    r'(?i)(select|insert|update|delete|drop|create|alter)',
+    r'(?i)(exec|execute|script|javascript|vbscript)',
+    r'(?i)(onload|onerror|onclick|onmouseover)',
+    r'(\-\-|\/\*|\*\/|\;|\|\||&&)',
+    r'(\b(0x[0-9a-fA-F]+)\b)',  # Hexadecimal values
+    r'(\b(0b[01]+)\b)',          # Binary values
+    r'(?i)(\bor\b|\band\b)',     # OR/AND operators
+)
+_RE_SQL = tuple(re.compile(pattern) for pattern in _SQL_PATTERNS)
+# La validación estricta (_validate_sql_injection) ignora mayúsculas en todos los patrones
+_RE_SQL_IGNORECASE = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _SQL_PATTERNS)
+
+_RE_NOSQL = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\$where|\$ne|\$gt|\$lt|\$gte|\$lte)',
+    r'(\$regex|\$options|\$text|\$search)',
+    r'(\$or|\$and|\$not|\$nor)',
+    r'(\$exists|\$type|\$mod|\$in|\$nin)',
+    r'(\$all|\$elemMatch|\$size|\$push|\$pull)',
+    r'(\$inc|\$set|\$unset|\$rename|\$currentDate)',
+))
+
+_RE_SUSPICIOUS = tuple(re.compile(pattern) for pattern in (
+    r'\.\.',           # Directory traversal
+    r'\/\/',           # URL injection
+    r'\\\\',           # Path injection
+    r'\.\.\/',         # Directory traversal
+    r'\.\.\\',         # Windows path injection
+))
+
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_RE_REPEATED_WARNING = re.compile(r'(.)\1{4,}')
+
+
+@lru_cache(maxsize=None)
+def _repeated_chars_pattern(max_repetition: int) -> Pattern[str]:
+    """Compiled pattern for a run of more than ``max_repetition`` equal characters."""
+    return re.compile(rf'(.)\1{{{max_repetition},}}')
+
 
 @dataclass
 class ValidationResult:
@@ -24,34 +87,14 @@ class UnifiedValidator:
     
     def __init__(self):
         # SQL Injection patterns (from security_validator_schema.py)
-        self.sql_patterns = [
-            r'(?i)(select|insert|update|delete|drop|create|alter)',
-            r'(?i)(exec|execute|script|javascript|vbscript)',
-            r'(?i)(onload|onerror|onclick|onmouseover)',
-            r'(\-\-|\/\*|\*\/|\;|\|\||&&)',
-            r'(\b(0x[0-9a-fA-F]+)\b)',  # Hexadecimal values
-            r'(\b(0b[01]+)\b)',          # Binary values
-            r'(?i)(\bor\b|\band\b)',     # OR/AND operators
-        ]
+        self.sql_patterns = _RE_SQL
+        self._sql_patterns_ignorecase = _RE_SQL_IGNORECASE
         
         # NoSQL Injection patterns
-        self.nosql_patterns = [
-            r'(\$where|\$ne|\$gt|\$lt|\$gte|\$lte)',
-            r'(\$regex|\$options|\$text|\$search)',
-            r'(\$or|\$and|\$not|\$nor)',
-            r'(\$exists|\$type|\$mod|\$in|\$nin)',
-            r'(\$all|\$elemMatch|\$size|\$push|\$pull)',
-            r'(\$inc|\$set|\$unset|\$rename|\$currentDate)',
-        ]
+        self.nosql_patterns = _RE_NOSQL
         
         # Suspicious patterns
-        self.suspicious_patterns = [
-            r'\.\.',           # Directory traversal
-            r'\/\/',           # URL injection
-            r'\\\\',           # Path injection
-            r'\.\.\/',         # Directory traversal
-            r'\.\.\\',         # Windows path injection
-        ]
+        self.suspicious_patterns = _RE_SUSPICIOUS
     
     def validate_input_layer(self, data: str, field_name: str) -> ValidationResult:
         """Basic input validation layer."""
@@ -85,19 +128,19 @@ class UnifiedValidator:
             
             # Check SQL Injection patterns
             for pattern in self.sql_patterns:
-                if re.search(pattern, sanitized):
+                if pattern.search(sanitized):
                     errors.append(f"{field_name} contains SQL injection patterns")
                     break
             
             # Check NoSQL Injection patterns
             for pattern in self.nosql_patterns:
-                if re.search(pattern, sanitized, re.IGNORECASE):
+                if pattern.search(sanitized):
                     errors.append(f"{field_name} contains NoSQL injection patterns")
                     break
             
             # Check suspicious patterns
             for pattern in self.suspicious_patterns:
-                if re.search(pattern, sanitized):
+                if pattern.search(sanitized):
                     errors.append(f"{field_name} contains suspicious patterns")
                     break
             
@@ -116,7 +159,8 @@ class UnifiedValidator:
     
     def validate_business_layer(self, data: str, field_name: str, 
                                min_length: int = 3, max_length: int = 100,
-                               allowed_chars: Optional[str] = None) -> ValidationResult:
+                               allowed_chars: Union[str, Pattern[str], None] = None,
+                               generic_names: Collection[str] = GENERIC_NAMES) -> ValidationResult:
         """Business logic validation layer."""
         start_time = time.time()
         errors = []
@@ -133,16 +177,15 @@ class UnifiedValidator:
                 errors.append(f"{field_name} too long (max {max_length} characters)")
             
             # Character validation
-            if allowed_chars and not re.match(allowed_chars, sanitized):
+            if allowed_chars and not _match_pattern(allowed_chars, sanitized):
                 errors.append(f"{field_name} contains unsupported characters")
             
             # Generic name validation
-            generic_names = ['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
             if sanitized.lower() in generic_names:
                 warnings.append(f"{field_name} is generic")
             
             # Repeated characters validation
-            if re.search(r'(.)\1{4,}', sanitized):
+            if _RE_REPEATED_WARNING.search(sanitized):
                 warnings.append(f"{field_name} contains many repeated characters")
             
             if errors:
@@ -170,7 +213,7 @@ class UnifiedValidator:
             normalized = self._normalize_unicode(sanitized)
             
             # Extra whitespace normalization
-            final_value = re.sub(r'\s+', ' ', normalized).strip()
+            final_value = _RE_WHITESPACE.sub(' ', normalized).strip()
             
             return ValidationResult(True, final_value, errors, warnings, time.time() - start_time)
             
@@ -180,8 +223,8 @@ class UnifiedValidator:
     
     def validate_with_timing_protection(self, data: str, field_name: str,
                                       min_length: int = 3, max_length: int = 100,
-                                      allowed_chars: Optional[str] = None,
-                                      generic_names: Optional[List[str]] = None) -> ValidationResult:
+                                      allowed_chars: Union[str, Pattern[str], None] = None,
+                                      generic_names: Optional[Collection[str]] = None) -> ValidationResult:
         """Complete validation with timing protection."""
         start_time = time.time()
         
@@ -197,7 +240,10 @@ class UnifiedValidator:
                 return result
             
             # Layer 3: Business logic validation
-            result = self.validate_business_layer(data, field_name, min_length, max_length, allowed_chars)
+            result = self.validate_business_layer(
+                data, field_name, min_length, max_length, allowed_chars,
+                GENERIC_NAMES if generic_names is None else generic_names
+            )
             if not result.is_valid:
                 return result
             
@@ -217,7 +263,7 @@ class UnifiedValidator:
             
             return ValidationResult(False, None, [f"Validation failed: {str(e)}"], [], time.time() - start_time)
     
-    def validate_simple(self, value: str, allowed_pattern: str, field_name: str,
+    def validate_simple(self, value: str, allowed_pattern: Union[str, Pattern[str]], field_name: str,
                        max_repeated_chars: int = 3, normalize_whitespace: bool = True,
                        to_upper: bool = False) -> str:
         """Simple validation for backward compatibility with original validators.py."""
@@ -226,7 +272,7 @@ class UnifiedValidator:
         
         # Normalize whitespace if requested
         if normalize_whitespace:
-            value = re.sub(r'\s+', ' ', value.strip())
+            value = _RE_WHITESPACE.sub(' ', value.strip())
         
         # Convert to uppercase if requested
         if to_upper:
@@ -239,12 +285,12 @@ class UnifiedValidator:
                     raise ValueError(f"{field_name} cannot have more than {max_repeated_chars} repeated characters")
         
         # Check against allowed pattern
-        if not re.match(allowed_pattern, value):
+        if not _match_pattern(allowed_pattern, value):
             raise ValueError(f"{field_name} contains invalid characters")
         
         return value
     
-    def validate_secure_string(self, value: str, allowed_pattern: str, field_name: str = "Value",
+    def validate_secure_string(self, value: str, allowed_pattern: Union[str, Pattern[str], None] = None, field_name: str = "Value",
                               min_length: int = 1, max_length: int = 255, max_repeated_chars: int = 10,
                               normalize_whitespace: bool = True, to_upper: bool = False,
                               required: bool = True, forbidden_generic_names: Optional[List[str]] = None) -> str:
@@ -252,44 +298,98 @@ class UnifiedValidator:
         start_time = time.time()
         
         try:
-            if not required and (not value or not value.strip()):
-                return value if value is not None else ""
-            
-            if not value or not value.strip():
-                raise ValueError(f"{field_name} cannot be empty or only whitespace")
-            
-            # Normalize whitespace
-            if normalize_whitespace:
-                if to_upper:
-                    sanitized = re.sub(r'\s+', '_', value.strip().upper())
-                else:
-                    sanitized = re.sub(r'\s+', ' ', value.strip())
-            else:
-                sanitized = value.strip()
-                if to_upper:
-                    sanitized = sanitized.upper()
+            normalized = self._secure_value(
+                value, allowed_pattern, field_name, min_length, max_length, max_repeated_chars,
+                normalize_whitespace, to_upper, required, forbidden_generic_names
+            )
             
-            # Length validation
-            if len(sanitized) < min_length:
-                raise ValueError(f"{field_name} too short (min {min_length} characters)")
+            # Timing attack protection
+            self._timing_attack_protection(start_time)
             
-            if len(sanitized) > max_length:
-                raise ValueError(f"{field_name} too long (max {max_length} characters)")
+            return normalized
             
-            # Generic names validation
-            if forbidden_generic_names and sanitized.lower() in [name.lower() for name in forbidden_generic_names]:
-                raise ValueError(f"{field_name} is too generic")
+        except Exception as e:
+            # Normalize error timing
+            self._timing_attack_protection(start_time)
+            raise e
+    
+    def validate_secure_strings(self, values: List[str], allowed_pattern: Union[str, Pattern[str], None] = None,
+                                field_name: str = "Value", min_length: int = 1, max_length: int = 255,
+                                max_repeated_chars: int = 10, normalize_whitespace: bool = True,
+                                to_upper: bool = False) -> List[str]:
+        """Secure validation of a list of strings under a single timing window."""
+        start_time = time.time()
+        
+        try:
+            normalized = [
+                self._secure_value(
+                    value, allowed_pattern, field_name, min_length, max_length, max_repeated_chars,
+                    normalize_whitespace, to_upper, True, None
+                )
+                for value in values
+            ]
             
-            # Security validations
-            self._validate_sql_injection(sanitized)
-            self._validate_nosql_injection(sanitized)
-            self._validate_suspicious_patterns(sanitized)
-            self._validate_repeated_characters(sanitized, max_repeated_chars)
+            # Timing attack protection
+            self._timing_attack_protection(start_time)
             
-            # Format validation
-            if not re.match(allowed_pattern, sanitized):
-                raise ValueError(f"{field_name} contains invalid characters")
+            return normalized
             
+        except Exception as e:
+            # Normalize error timing
+            self._timing_attack_protection(start_time)
+            raise e
+    
+    def _secure_value(self, value: str, allowed_pattern: Union[str, Pattern[str], None], field_name: str,
+                      min_length: int, max_length: int, max_repeated_chars: int,
+                      normalize_whitespace: bool, to_upper: bool, required: bool,
+                      forbidden_generic_names: Optional[List[str]]) -> str:
+        """Checks and normalization of ``validate_secure_string``, without timing protection."""
+        if not required and (not value or not value.strip()):
+            return value if value is not None else ""
+        
+        if not value or not value.strip():
+            raise ValueError(f"{field_name} cannot be empty or only whitespace")
+        
+        # Normalize whitespace
+        if normalize_whitespace:
+            if to_upper:
+                sanitized = _RE_WHITESPACE.sub('_', value.strip().upper())
+            else:
+                sanitized = _RE_WHITESPACE.sub(' ', value.strip())
+        else:
+            sanitized = value.strip()
+            if to_upper:
+                sanitized = sanitized.upper()
+        
+        # Length validation
+        if len(sanitized) < min_length:
+            raise ValueError(f"{field_name} too short (min {min_length} characters)")
+        
+        if len(sanitized) > max_length:
+            raise ValueError(f"{field_name} too long (max {max_length} characters)")
+        
+        # Generic names validation
+        if forbidden_generic_names and sanitized.lower() in [name.lower() for name in forbidden_generic_names]:
+            raise ValueError(f"{field_name} is too generic")
+        
+        # Plain ASCII values (e.g. already restricted by StringConstraints.pattern)
+        # cannot match the NoSQL/path patterns nor change on sanitization
+        plain = _is_plain(sanitized)
+        
+        # Security validations
+        self._validate_sql_injection(sanitized)
+        if not plain:
+            self._validate_nosql_injection(sanitized)
+            self._validate_suspicious_patterns(sanitized)
+        self._validate_repeated_characters(sanitized, max_repeated_chars)
+        
+        # Format validation (skipped when the field type already enforces the pattern)
+        if allowed_pattern is not None and not _match_pattern(allowed_pattern, sanitized):
+            raise ValueError(f"{field_name} contains invalid characters")
+        
+        if plain:
+            normalized = sanitized
+        else:
             # HTML sanitization
             sanitized = self._sanitize_html(sanitized)
             
@@ -298,39 +398,30 @@ class UnifiedValidator:
             
             # Control character validation
             self._validate_control_characters(normalized)
-            
-            # Timing attack protection
-            self._timing_attack_protection(start_time)
-            
-            return normalized
-            
-        except Exception as e:
-            # Normalize error timing
-            self._timing_attack_protection(start_time)
-            raise e
+        
+        return normalized
     
     def _validate_sql_injection(self, value: str) -> None:
         """Validate against SQL injection patterns."""
-        for pattern in self.sql_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+        for pattern in self._sql_patterns_ignorecase:
+            if pattern.search(value):
                 raise ValueError("Value contains potentially malicious SQL patterns")
     
     def _validate_nosql_injection(self, value: str) -> None:
         """Validate against NoSQL injection patterns."""
         for pattern in self.nosql_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+            if pattern.search(value):
                 raise ValueError("Value contains NoSQL injection patterns")
     
     def _validate_suspicious_patterns(self, value: str) -> None:
         """Validate against suspicious patterns."""
         for pattern in self.suspicious_patterns:
-            if re.search(pattern, value):
+            if pattern.search(value):
                 raise ValueError("Value contains suspicious patterns")
     
     def _validate_repeated_characters(self, value: str, max_repetition: int = 10) -> None:
         """Validate against excessive character repetition."""
-        pattern = rf'(.)\1{{{max_repetition},}}'
-        if re.search(pattern, value):
+        if _repeated_chars_pattern(max_repetition).search(value):
             raise ValueError(f"Value contains too many repeated characters (max {max_repetition})")
     
     def _check_control_characters(self, value: str, field_name: str) -> List[str]:
@@ -340,7 +431,7 @@ class UnifiedValidator:
         if '\x00' in value:
             errors.append(f"{field_name} contains null bytes")
         
-        if re.search(r'[\x00-\x1f\x7f-\x9f]', value):
+        if _RE_CONTROL_CHARS.search(value):
             errors.append(f"{field_name} contains control characters")
         
         return errors
@@ -378,7 +469,7 @@ unified_validator = UnifiedValidator()
 
 
 # Backward compatibility functions
-def validate_secure_string(value: str, allowed_pattern: str, field_name: str,
+def validate_secure_string(value: str, allowed_pattern: Union[str, Pattern[str]], field_name: str,
                           max_repeated_chars: int = 3, normalize_whitespace: bool = True,
                           to_upper: bool = False) -> str:
     """
@@ -386,7 +477,7 @@ def validate_secure_string(value: str, allowed_pattern: str, field_name: str,
     
     Args:
         value: The string value to validate
-        allowed_pattern: Regex pattern for allowed characters
+        allowed_pattern: Regex pattern (string or precompiled) for allowed characters
         field_name: Name of the field for error messages
         max_repeated_chars: Maximum number of repeated characters allowed
         normalize_whitespace: Whether to normalize whitespace
@@ -408,7 +499,7 @@ def validate_secure_string(value: str, allowed_pattern: str, field_name: str,
     )
 
 
-def validate_secure_string_advanced(value: str, allowed_pattern: str, field_name: str = "Value",
+def validate_secure_string_advanced(value: str, allowed_pattern: Union[str, Pattern[str], None] = None, field_name: str = "Value",
                                    min_length: int = 1, max_length: int = 255, 
                                    max_repeated_chars: int = 10, normalize_whitespace: bool = True,
                                    to_upper: bool = False, required: bool = True,
@@ -418,7 +509,8 @@ def validate_secure_string_advanced(value: str, allowed_pattern: str, field_name
     
     Args:
         value: String to validate
-        allowed_pattern: Regex pattern for allowed characters
+        allowed_pattern: Regex pattern (string or precompiled) for allowed characters;
+            ``None`` when the field type already enforces it (``StringConstraints``)
         field_name: Name of the field for error messages
         min_length: Minimum allowed length
         max_length: Maximum allowed length
@@ -448,10 +540,48 @@ def validate_secure_string_advanced(value: str, allowed_pattern: str, field_name
     )
 
 
+def validate_secure_strings_advanced(values: List[str], allowed_pattern: Union[str, Pattern[str], None] = None,
+                                    field_name: str = "Value", min_length: int = 1, max_length: int = 255,
+                                    max_repeated_chars: int = 10, normalize_whitespace: bool = True,
+                                    to_upper: bool = False) -> List[str]:
+    """
+    ``validate_secure_string_advanced`` for every item of a list.
+    
+    Each item gets the same security checks, but the timing protection
+    covers the whole list instead of adding its minimum duration per item.
+    
+    Args:
+        values: Strings to validate
+        allowed_pattern: Regex pattern (string or precompiled) for allowed characters
+        field_name: Name of the field for error messages
+        min_length: Minimum allowed length
+        max_length: Maximum allowed length
+        max_repeated_chars: Maximum allowed repeated characters
+        normalize_whitespace: Whether to normalize whitespace
+        to_upper: Whether to convert to uppercase
+        
+    Returns:
+        Validated and sanitized strings, in the same order
+        
+    Raises:
+        ValueError: If validation of any item fails
+    """
+    return unified_validator.validate_secure_strings(
+        values=values,
+        allowed_pattern=allowed_pattern,
+        field_name=field_name,
+        min_length=min_length,
+        max_length=max_length,
+        max_repeated_chars=max_repeated_chars,
+        normalize_whitespace=normalize_whitespace,
+        to_upper=to_upper
+    )
+
+
 def validate_with_timing_protection(value: str, field_name: str,
                                   min_length: int = 3, max_length: int = 100,
-                                  allowed_chars: Optional[str] = None,
-                                  generic_names: Optional[List[str]] = None) -> str:
+                                  allowed_chars: Union[str, Pattern[str], None] = None,
+                                  generic_names: Optional[Collection[str]] = None) -> str:
     """
     Validation with timing protection, returns string.
     
@@ -460,8 +590,8 @@ def validate_with_timing_protection(value: str, field_name: str,
         field_name: Name of the field for error messages
         min_length: Minimum allowed length
         max_length: Maximum allowed length
-        allowed_chars: Regex pattern for allowed characters
-        generic_names: List of generic names to reject
+        allowed_chars: Regex pattern (string or precompiled) for allowed characters
+        generic_names: Generic names to flag (defaults to GENERIC_NAMES)
         
     Returns:
         Validated and sanitized string
@@ -486,10 +616,12 @@ def validate_with_timing_protection(value: str, field_name: str,
 
 # Export the main validator class for advanced usage
 __all__ = [
+    'GENERIC_NAMES',
     'UnifiedValidator',
     'ValidationResult',
     'unified_validator',
     'validate_secure_string',
     'validate_secure_string_advanced',
+    'validate_secure_strings_advanced',
     'validate_with_timing_protection'
 ]
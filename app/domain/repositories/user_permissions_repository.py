@@ -1,7 +1,7 @@
 """User permissions repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Sequence
 
 from app.interfaces.schemas.security_schema import User, Roles
 
@@ -12,7 +12,7 @@ class UserPermissionsRepository(ABC):
     @abstractmethod
     async def get_permissions_by_user(
         self, 
-        permissions: List[Roles], 
+        permissions: Sequence[Roles], 
         user_email: str, 
         user_bu_id: int
     ) -> List[str]:
@@ -23,7 +23,8 @@ class UserPermissionsRepository(ABC):
     async def check_db_permissions(
         self, 
         user: User, 
-        permissions: List[Roles]
+        permissions: Sequence[Roles],
+        required_mask: Optional[int] = None
     ) -> bool:
         """Check if user has required permissions in database."""
         pass
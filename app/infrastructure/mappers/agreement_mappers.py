@@ -1,5 +1,6 @@
 
-from typing import List
+from operator import attrgetter, itemgetter
+from typing import Callable, List
 from sqlalchemy.engine.row import Row
 from app.interfaces.schemas.agreement_schema import AgreementSearchResultItem
 from app.interfaces.schemas.agreement_schema import (
@@ -24,6 +25,43 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Columnas de search_agreements en el orden de AgreementSearchResultItem; solo
+# id y description cambian de nombre
+_SEARCH_COLUMN_RENAMES = {'id': 'agreement_id', 'description': 'agreement_description'}
+_SEARCH_ITEM_FIELDS = tuple(AgreementSearchResultItem.model_fields)
+_SEARCH_COLUMNS = tuple(_SEARCH_COLUMN_RENAMES.get(name, name) for name in _SEARCH_ITEM_FIELDS)
+_get_search_columns = attrgetter(*_SEARCH_COLUMNS)
+
+
+def _search_row_getter(row: Row) -> Callable[[Row], tuple]:
+    """
+    Return a callable reading the search columns from rows shaped like ``row``.
+
+    SQLAlchemy rows are read by position (resolved once per result set), which
+    avoids the per-attribute lookup of ``Row.__getattr__``; other row-like
+    objects are read by attribute.
+    """
+    if not isinstance(row, Row):
+        return _get_search_columns
+    fields = row._fields
+    missing = [column for column in _SEARCH_COLUMNS if column not in fields]
+    if missing:
+        raise AttributeError(f"'Row' object has no attribute {missing[0]!r}")
+    return itemgetter(*(fields.index(column) for column in _SEARCH_COLUMNS))
+
+
+def _build_search_item(values: tuple) -> AgreementSearchResultItem:
+    data = dict(zip(_SEARCH_ITEM_FIELDS, values))
+    created_at = data['created_at']
+    updated_at = data['updated_at']
+    data['created_at'] = created_at.isoformat() if hasattr(created_at, 'isoformat') else str(created_at)
+    data['updated_at'] = updated_at.isoformat() if hasattr(updated_at, 'isoformat') else str(updated_at)
+    data['created_by_user_email'] = data['created_by_user_email'] or ""
+    data['status_id'] = data['status_id'] or ""
+    data['rebate_type_id'] = data['rebate_type_id'] or ""
+    return AgreementSearchResultItem(**data)
+
+
 def map_search_result_to_agreement_item(row: Row) -> AgreementSearchResultItem:
     """
     Map PostgreSQL function result to AgreementSearchResultItem.
@@ -31,70 +69,15 @@ def map_search_result_to_agreement_item(row: Row) -> AgreementSearchResultItem:
     This function maps all fields returned by the search_agreements PostgreSQL function
     including agreement details, status descriptions, product information, and supplier data.
     """
+    return map_search_results_to_agreement_items([row])[0]
+
+
+def map_search_results_to_agreement_items(rows: list[Row]) -> list[AgreementSearchResultItem]:
+    if not rows:
+        return []
     try:
-        return AgreementSearchResultItem(
-            # Basic agreement information
-            id=row.agreement_id,
-            agreement_number=row.agreement_number,
-            description=row.agreement_description,
-            source_system=row.source_system,
-            start_date=row.start_date,
-            end_date=row.end_date,
-            created_at=row.created_at.isoformat() if hasattr(row.created_at, 'isoformat') else str(row.created_at),
-            created_by_user_email=row.created_by_user_email or "",
-            updated_at=row.updated_at.isoformat() if hasattr(row.updated_at, 'isoformat') else str(row.updated_at),
-            updated_status_by_user_email=row.updated_status_by_user_email,
-            
-            # Status information
-            status_id=row.status_id or "",
-            status_description=row.status_description,
-            
-            # Rebate type information
-            rebate_type_id=row.rebate_type_id or "",
-            rebate_type_description=row.rebate_type_description,
-            
-            # Concept information
-            concept_id=row.concept_id,
-            concept_description=row.concept_description,
-            
-            # SPF information
-            spf_code=row.spf_code,
-            spf_description=row.spf_description,
-            
-            # Financial information
-            currency_id=row.currency_id,
-            currency_code=row.currency_code,
-            unit_price=row.unit_price,
-            billing_type=row.billing_type,
-            billing_type_description=row.billing_type_description,
-            
-            # PMM information
-            pmm_username=row.pmm_username,
-            pmm_username_description=row.pmm_username_description,
-            
-            # Store grouping information
-            store_grouping_id=row.store_grouping_id,
-            store_grouping_description=row.store_grouping_description,
-            
-            # Product information
-            sku_code=row.sku_code,
-            sku_description=row.sku_description,
-            division_code=row.division_code,
-            division_name=row.division_name,
-            department_code=row.department_code,
-            department_name=row.department_name,
-            subdepartment_code=row.subdepartment_code,
-            subdepartment_name=row.subdepartment_name,
-            class_code=row.class_code,
-            class_name=row.class_name,
-            subclass_code=row.subclass_code,
-            subclass_name=row.subclass_name,
-            brand_id=row.brand_id,
-            brand_name=row.brand_name,
-            supplier_id=row.supplier_id,
-            supplier_name=row.supplier_name,
-            supplier_ruc=row.supplier_ruc,
-        )
+        get_columns = _search_row_getter(rows[0])
+        return [_build_search_item(get_columns(row)) for row in rows]
     except AttributeError as e:
         logger.error(f"Missing required column in database row: {e}")
         raise AttributeError(f"Missing required column in database row: {e}")
@@ -103,10 +86,6 @@ def map_search_result_to_agreement_item(row: Row) -> AgreementSearchResultItem:
         raise ValueError(f"Data type conversion error: {e}")
 
 
-def map_search_results_to_agreement_items(rows: list[Row]) -> list[AgreementSearchResultItem]:
-    return [map_search_result_to_agreement_item(row) for row in rows]
-
-
 def map_request_to_agreement_product(request: AgreementProductCreateRequest, agreement_id: int) -> AgreementProduct:
     try:
         return AgreementProduct(
@@ -254,7 +233,7 @@ def map_requests_to_agreement_excluded_flags(requests: List[AgreementExcludedFla
 def map_agreement_to_response(agreement: Agreement) -> AgreementResponse:
     """Map Agreement domain entity to AgreementResponse."""
     try:
-        return AgreementResponse(
+        return AgreementResponse.build_trusted(
             id=agreement.id,
             business_unit_id=agreement.business_unit_id,
             agreement_number=agreement.agreement_number,
@@ -317,9 +296,9 @@ def map_product_to_response(product: AgreementProduct) -> AgreementProductRespon
             supplier_name=product.supplier_name,
             supplier_ruc=product.supplier_ruc,
             active=product.active,
-            created_at=product.created_at.isoformat() if product.created_at else None,
+            created_at=product.created_at,
             created_by_user_email=product.created_by_user_email,
-            updated_at=product.updated_at.isoformat() if product.updated_at else None,
+            updated_at=product.updated_at,
             updated_status_by_user_email=product.updated_status_by_user_email
         )
     except Exception as e:
@@ -355,9 +334,9 @@ def map_excluded_flag_to_response(excluded_flag: AgreementExcludedFlag) -> Agree
             agreement_id=excluded_flag.agreement_id,
             excluded_flag_id=excluded_flag.excluded_flag_id,
             active=excluded_flag.active,
-            created_at=excluded_flag.created_at.isoformat() if excluded_flag.created_at else None,
+            created_at=excluded_flag.created_at,
             created_by_user_email=excluded_flag.created_by_user_email,
-            updated_at=excluded_flag.updated_at.isoformat() if excluded_flag.updated_at else None,
+            updated_at=excluded_flag.updated_at,
             updated_status_by_user_email=excluded_flag.updated_status_by_user_email,
             excluded_flag_name=excluded_flag.excluded_flag_name
         )
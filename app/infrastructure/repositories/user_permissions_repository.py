@@ -1,13 +1,13 @@
 """SQLAlchemy implementation of UserPermissionsRepository."""
 
-from typing import List
+from typing import List, Optional, Sequence
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from starlette import status
 
-from app.interfaces.schemas.security_schema import Roles, User
+from app.interfaces.schemas.security_schema import Roles, User, required_roles_mask, roles_mask
 from app.domain.repositories.user_permissions_repository import (
     UserPermissionsRepository,
 )
@@ -15,6 +15,18 @@ from app.infrastructure.postgres.models.tottus import ModulesModel, ModuleUsersM
 from app.infrastructure.postgres.session import AsyncSessionLocal 
 from app.core.constants import NOT_ALLOW
 
+# Consulta construida una sola vez; los valores van como parámetros, de modo que
+# SQLAlchemy reutiliza el SQL compilado y asyncpg el prepared statement por conexión
+_USER_PERMISSIONS_STMT = (
+    select(ModulesModel.name)
+    .join(ModuleUsersModel, ModuleUsersModel.module_id == ModulesModel.id)
+    .where(ModuleUsersModel.user_email == bindparam("user_email"))
+    .where(ModulesModel.is_active.is_(True))
+    .where(ModulesModel.business_unit_id == bindparam("user_bu_id"))
+    .where(ModulesModel.name.in_(bindparam("permission_names", expanding=True)))
+)
+
+
 class UserPermissionsRepository(UserPermissionsRepository):
     """SQLAlchemy implementation of user permissions repository."""
 
@@ -23,7 +35,7 @@ class UserPermissionsRepository(UserPermissionsRepository):
 
     async def get_permissions_by_user(
         self, 
-        permissions: List[Roles], 
+        permissions: Sequence[Roles], 
         user_email: str, 
         user_bu_id: int
     ) -> List[str]:
@@ -34,16 +46,14 @@ class UserPermissionsRepository(UserPermissionsRepository):
         permission_names = [p.value for p in permissions]
         
         # Use async SQLAlchemy query
-        stmt = (
-            select(ModulesModel.name)
-            .join(ModuleUsersModel, ModuleUsersModel.module_id == ModulesModel.id)
-            .where(ModuleUsersModel.user_email == user_email)
-            .where(ModulesModel.is_active.is_(True))
-            .where(ModulesModel.business_unit_id == user_bu_id)
-            .where(ModulesModel.name.in_(permission_names))
+        result = await self._session.execute(
+            _USER_PERMISSIONS_STMT,
+            {
+                "user_email": user_email,
+                "user_bu_id": user_bu_id,
+                "permission_names": permission_names,
+            },
         )
-        
-        result = await self._session.execute(stmt)
         rows = result.scalars().all()
         
         if not rows:
@@ -54,10 +64,13 @@ class UserPermissionsRepository(UserPermissionsRepository):
     async def check_db_permissions(
         self, 
         user: User, 
-        permissions: List[Roles]
+        permissions: Sequence[Roles],
+        required_mask: Optional[int] = None
     ) -> bool:
         """
         Check if user has required permissions in database.
+        ``required_mask`` is ``required_roles_mask(permissions)``, precomputed by
+        callers that check the same permissions on every request.
         Deprecated: Remove when roles are implemented in Keycloak and not in the database.
         """
         if not user.bu_id:
@@ -76,13 +89,10 @@ class UserPermissionsRepository(UserPermissionsRepository):
             permissions, user.email, user.bu_id
         )
         
-        missing_permissions: List[str] = []
-        for permission in permissions:
-            if permission.value not in modules:
-                missing_permissions.append(permission.name)
-                
-        if missing_permissions:
-            # logging.info(f'User "{user.email}" has not permissions: {missing_permissions}')
+        # Todos los permisos requeridos deben estar entre los módulos asignados
+        if required_mask is None:
+            required_mask = required_roles_mask(permissions)
+        if roles_mask(modules) & required_mask != required_mask:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, 
                 detail=NOT_ALLOW
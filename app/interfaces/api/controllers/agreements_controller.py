@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional, List
+from pydantic import TypeAdapter
 
 from app.interfaces.schemas import (
     AgreementResponse,
@@ -29,7 +31,8 @@ router = APIRouter(
     dependencies=[
         Depends(get_country_header),
         Depends(security_scheme)
-    ]
+    ],
+    default_response_class=ORJSONResponse,
 )
  
 class AgreementController(LoggerMixin):
@@ -295,6 +298,12 @@ class AgreementController(LoggerMixin):
 
 controller = AgreementController()
 
+# Serializadores tipados de las respuestas, construidos una sola vez: con el
+# tipo concreto pydantic-core no infiere el tipo de cada ítem al volcar ``data``
+_CREATE_RESPONSE_ADAPTER = TypeAdapter(AgreementCreateSuccessResponse)
+_SEARCH_RESPONSE_ADAPTER = TypeAdapter(PaginatedResponse[AgreementSearchResponse])
+_DETAIL_RESPONSE_ADAPTER = TypeAdapter(SuccessResponse[AgreementDetailResponse])
+
 @router.post(
     "/",
     response_model=AgreementCreateSuccessResponse,
@@ -305,11 +314,12 @@ async def create_agreement(
     request: Request,
     agreement_data: AgreementCreateRequest,
     use_cases: AgreementUseCasesDep,
-) -> AgreementCreateSuccessResponse:
+) -> Response:
     response_data = await controller.create_agreement(request, agreement_data, use_cases)
-    return create_success_response(
-        data=response_data,
-        message="Agreement created successfully"
+    # El schema de respuesta es el mismo de response_model: se vuelca a JSON una sola vez
+    return Response(
+        _CREATE_RESPONSE_ADAPTER.dump_json(AgreementCreateSuccessResponse.from_agreement(response_data)),
+        media_type="application/json",
     )
 
 
@@ -324,8 +334,11 @@ async def search_agreements(
     request: Request,
     search_request: AgreementSearchRequest,
     use_cases: AgreementUseCasesDep
-) -> PaginatedResponse[AgreementSearchResponse]:
-    return await controller.search_agreements(request, search_request, use_cases)
+) -> Response:
+    search_response = await controller.search_agreements(request, search_request, use_cases)
+    # Los ítems ya se validaron al mapear las filas: se vuelcan a JSON una sola vez en
+    # pydantic-core, sin el ida y vuelta dump/validación de response_model
+    return Response(_SEARCH_RESPONSE_ADAPTER.dump_json(search_response), media_type="application/json")
 
 @router.get(
     "/{agreement_id}",
@@ -337,8 +350,10 @@ async def get_agreement_by_id(
     request: Request,
     agreement_id: int,
     use_cases: AgreementUseCasesDep
-) -> SuccessResponse[AgreementDetailResponse]:
-    return await controller.get_agreement_by_id(request, agreement_id, use_cases)
+) -> Response:
+    detail_response = await controller.get_agreement_by_id(request, agreement_id, use_cases)
+    # El detalle ya viene validado del caso de uso: se vuelca a JSON una sola vez
+    return Response(_DETAIL_RESPONSE_ADAPTER.dump_json(detail_response), media_type="application/json")
 
 @router.put(
     "/{agreement_id}",
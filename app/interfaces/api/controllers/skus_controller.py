@@ -1,8 +1,12 @@
+import re
+from types import MappingProxyType
+
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 
 from app.interfaces.dependencies.auth_dependencies import check_db_permissions_simple
 from app.interfaces.schemas.security_schema import Roles, User
-from app.interfaces.schemas.sku_schema import SkuCodesRequest, SkusResponse
+from app.interfaces.schemas.sku_schema import SKU_CODES_ADAPTER, SkusResponse
 from app.core.response import create_error_response
 from app.core.logging import LoggerMixin
 from app.interfaces.dependencies import SkuUseCasesDep
@@ -14,9 +18,16 @@ router = APIRouter(
     dependencies=[
         Depends(get_country_header),
         Depends(security_scheme)
-    ]
+    ],
+    default_response_class=ORJSONResponse,
 )
 
+# Pre-built 500 payload (ErrorResponse shape), kept read-only and copied per raise
+_INTERNAL_ERROR_DETAIL = MappingProxyType(create_error_response(message="Internal server error").model_dump())
+
+# Splits on commas and trims surrounding whitespace in a single pass
+_SKU_SPLIT_RE = re.compile(r'\s*,\s*')
+
 class SkuController(LoggerMixin):
 
     async def get_skus_by_codes(
@@ -32,25 +43,28 @@ class SkuController(LoggerMixin):
             # Validate specific DB permissions
             # await check_db_permissions_simple(user, [Roles.ACCESS_AGREEMENTS])
             
-            sku_codes_list = [code.strip() for code in sku_codes.split(',') if code.strip()]
+            sku_codes_list = [code for code in _SKU_SPLIT_RE.split(sku_codes.strip()) if code]
             
-            self.log_info(
-                "Obteniendo SKUs por códigos",
-                sku_codes_count=len(sku_codes_list),
-                sku_codes=sku_codes_list[:5]  # Log solo los primeros 5
-            )
+            info_enabled = self.info_enabled
+            if info_enabled:
+                self.log_info(
+                    "Obteniendo SKUs por códigos",
+                    sku_codes_count=len(sku_codes_list),
+                    sku_codes=sku_codes_list[:5]  # Log solo los primeros 5
+                )
 
-            validated_request = SkuCodesRequest(sku_codes=sku_codes_list)
+            validated_codes = SKU_CODES_ADAPTER.validate_python(sku_codes_list)
 
-            skus = await sku_use_cases.get_skus_by_codes(validated_request)
+            skus = await sku_use_cases.get_skus_by_codes(validated_codes)
 
             response_data = SkusResponse.from_domain_models(skus, sku_codes_list)
 
-            self.log_info(
-                "SKUs obtenidos exitosamente",
-                requested_count=len(sku_codes_list),
-                found_count=response_data.count
-            )
+            if info_enabled:
+                self.log_info(
+                    "SKUs obtenidos exitosamente",
+                    requested_count=len(sku_codes_list),
+                    found_count=response_data.count
+                )
 
             return response_data
 
@@ -62,9 +76,7 @@ class SkuController(LoggerMixin):
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=create_error_response(
-                    message=f"Invalid SKU codes: {str(e)}"
-                ).model_dump(),
+                detail={"success": False, "message": f"Invalid SKU codes: {str(e)}", "data": None},
             )
         except Exception as e:
             self.log_error(
@@ -74,16 +86,21 @@ class SkuController(LoggerMixin):
             )
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=create_error_response(message="Internal server error").model_dump(),
+                detail=dict(_INTERNAL_ERROR_DETAIL),
             )
 
 
 sku_controller = SkuController()
+# Bound once so endpoints skip the attribute lookup per request
+_get_skus_by_codes = sku_controller.get_skus_by_codes
 
 
+# response_model=None: the controller already returns a validated SkusResponse,
+# so FastAPI should not re-validate it; `responses` keeps the OpenAPI schema.
 @router.get(
     "/by-codes",
-    response_model=SkusResponse,
+    response_model=None,
+    responses={200: {"model": SkusResponse}},
     summary="Get SKUs by codes",
     description="Retrieve SKU information by providing a list of SKU codes",
 )
@@ -92,4 +109,4 @@ async def get_skus_by_codes(
     sku_codes: str,
     sku_use_cases: SkuUseCasesDep,
 ) -> SkusResponse:
-    return await sku_controller.get_skus_by_codes(request, sku_codes, sku_use_cases)
+    return await _get_skus_by_codes(request, sku_codes, sku_use_cases)
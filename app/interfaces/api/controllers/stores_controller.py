@@ -1,6 +1,8 @@
 """Store API controller."""
+from types import MappingProxyType
 from typing import List,Any
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from app.interfaces.dependencies.auth_dependencies import check_db_permissions_simple
 from app.interfaces.schemas import (
     ErrorResponse,
@@ -20,9 +22,15 @@ router = APIRouter(
     dependencies=[
         Depends(get_country_header),
         Depends(security_scheme)
-    ]
+    ],
+    default_response_class=ORJSONResponse,
 )
 
+# Pre-built error payloads (same shape as ErrorResponse.model_dump()); read-only,
+# each HTTPException gets its own copy
+_INTERNAL_ERROR_DETAIL = MappingProxyType(create_error_response(message="Internal server error").model_dump())
+_INVALID_STORE_ID_DETAIL = MappingProxyType(create_error_response(message="Invalid store ID").model_dump())
+
 class StoresController(LoggerMixin):
     """Controller for store operations with logging capabilities."""
     
@@ -55,7 +63,7 @@ class StoresController(LoggerMixin):
             )
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=create_error_response(message="Internal server error").model_dump(),
+                detail=dict(_INTERNAL_ERROR_DETAIL),
             )
 
     async def get_store_by_id(
@@ -74,7 +82,7 @@ class StoresController(LoggerMixin):
             # await check_db_permissions_simple(user, [Roles.ACCESS_AGREEMENTS])
  
             if store_id <= 0:
-                raise HTTPException(status_code=400, detail="Invalid store ID")
+                raise HTTPException(status_code=400, detail=dict(_INVALID_STORE_ID_DETAIL))
 
 
             self.log_info("Buscando tienda por ID", store_id=store_id)
@@ -87,9 +95,7 @@ class StoresController(LoggerMixin):
                 )
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
-                    detail=create_error_response(
-                        message=f"Store with ID {store_id} not found"
-                    ).model_dump(),
+                    detail={"success": False, "message": f"Store with ID {store_id} not found", "data": None},
                 )
             
             self.log_info("Tienda encontrada exitosamente", store_id=store_id)
@@ -107,11 +113,14 @@ class StoresController(LoggerMixin):
             )
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=create_error_response(message="Internal server error").model_dump(),
+                detail=dict(_INTERNAL_ERROR_DETAIL),
             )
 
 # Instancia del controlador
 store_controller = StoresController()
+# Bound once so endpoints skip the attribute lookup per request
+_get_active_stores = store_controller.get_active_stores
+_get_store_by_id = store_controller.get_store_by_id
 
 
 @router.get("/")
@@ -119,9 +128,12 @@ async def read_users():
     return [{"username": "Rick"}, {"username": "Morty"}]
 
 
+# response_model=None: the controller already returns a validated SuccessResponse,
+# so FastAPI should not re-validate it; `responses` keeps the OpenAPI schema.
 @router.get(
     "/active",
-    response_model=SuccessResponse[List[Any]],
+    response_model=None,
+    responses={200: {"model": SuccessResponse[List[Any]]}},
     summary="Get active stores",
     description="Retrieve all active stores ordered by store_id.",
 )
@@ -130,7 +142,7 @@ async def get_active_stores(
     use_cases: StoreUseCasesDep,
 ) -> SuccessResponse[List[Any]]:
     """Get all active stores ordered by store_id."""
-    return await store_controller.get_active_stores(request, use_cases)
+    return await _get_active_stores(request, use_cases)
 
 
 @router.get(
@@ -145,5 +157,5 @@ async def get_store_by_id(
     use_cases: StoreUseCasesDep,
 ) -> SuccessResponse[StoreResponse]:
     """Get a store by ID."""
-    return await store_controller.get_store_by_id(request, store_id, use_cases)
+    return await _get_store_by_id(request, store_id, use_cases)
 
@@ -1,6 +1,7 @@
 from .router_factory import (
     RouterFactory, 
     create_api_router, 
+    mount_api_router,
     get_router_status,
     clear_router_cache,
     reload_routers
@@ -20,6 +21,7 @@ __all__ = [
     # Factory
     "RouterFactory",
     "create_api_router",
+    "mount_api_router",
     "get_router_status",
     "clear_router_cache",
     "reload_routers",
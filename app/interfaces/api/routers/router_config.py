@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 from app.core.logging import LoggerMixin
 from .router_discovery import get_router_discovery, RouterMetadata
 
-@dataclass
+@dataclass(slots=True)
 class RouterConfig:
     name: str
     prefix: str
@@ -13,9 +13,6 @@ class RouterConfig:
     enabled: bool = True
     version: str = "v1"
     
-    def __post_init__(self):
-        self._validate()
-    
     def _validate(self) -> None:
         if not self.name or not self.name.strip():
             raise ValueError("El nombre del router no puede estar vacío")
@@ -34,8 +31,8 @@ class RouterConfig:
     
     @classmethod
     def from_metadata(cls, metadata: RouterMetadata) -> 'RouterConfig':
-        """Create RouterConfig from RouterMetadata."""
-        return cls(
+        """Create a validated RouterConfig from RouterMetadata."""
+        config = cls(
             name=metadata.name,
             prefix=metadata.prefix,
             tags=metadata.tags,
@@ -43,6 +40,8 @@ class RouterConfig:
             enabled=metadata.enabled,
             version=metadata.version
         )
+        config._validate()
+        return config
 
 
 def _get_dynamic_router_configs() -> Dict[str, RouterConfig]:
@@ -67,59 +66,89 @@ def _get_dynamic_router_configs() -> Dict[str, RouterConfig]:
 
 
 # Dynamic router configurations - no longer hardcoded!
-ROUTER_CONFIGS: Dict[str, RouterConfig] = _get_dynamic_router_configs()
+# Se construyen bajo demanda (ver get_router_configs) para no importar todos
+# los controllers al importar este módulo.
+_ROUTER_CONFIGS: Optional[Dict[str, RouterConfig]] = None
 
-# Validar todas las configuraciones al cargar el módulo
-def _validate_all_configs() -> None:
-    try:
-        # Crear un logger temporal para la validación del módulo
-        temp_logger = LoggerMixin()
-        
-        for name, config in ROUTER_CONFIGS.items():
-            temp_logger.log_debug("Validando configuración del router", router_name=name)
-            # La validación se ejecuta automáticamente en __post_init__
-        
-        temp_logger.log_info(
-            "Todas las configuraciones de routers validadas", 
-            total_routers=len(ROUTER_CONFIGS)
-        )
-        
-    except Exception as e:
-        # En caso de error, usar logging apropiado
-        temp_logger.log_error(f"Error al validar configuraciones de routers: {e}")
-        raise
+# Nombres de routers habilitados (dict como conjunto ordenado), mantenido
+# incrementalmente por add/remove/update para evitar re-escanear las configuraciones
+_ENABLED_ROUTERS: Dict[str, None] = {}
+
+# Índice inverso prefijo -> nombre para búsquedas O(1) en get_router_by_prefix
+_PREFIX_INDEX: Dict[str, str] = {}
 
-# Ejecutar validación al cargar el módulo
-_validate_all_configs()
+# Nombres configurados; se reconstruye solo al cargar, agregar o quitar un router
+_CONFIGURED_NAMES: FrozenSet[str] = frozenset()
+
+
+def _build_enabled_index(configs: Dict[str, RouterConfig]) -> Dict[str, None]:
+    """Build the ordered set of enabled router names."""
+    return {name: None for name, config in configs.items() if config.enabled}
+
+
+def _build_prefix_index(configs: Dict[str, RouterConfig]) -> Dict[str, str]:
+    """Build the prefix -> router name index (first router wins, as in a scan)."""
+    index: Dict[str, str] = {}
+    for name, config in configs.items():
+        index.setdefault(config.prefix, name)
+    return index
+
+
+def _load_router_configs() -> Dict[str, RouterConfig]:
+    """(Re)build router configurations and their indexes from discovery."""
+    global _ROUTER_CONFIGS, _ENABLED_ROUTERS, _PREFIX_INDEX, _CONFIGURED_NAMES
+    configs = _get_dynamic_router_configs()
+    _ENABLED_ROUTERS = _build_enabled_index(configs)
+    _PREFIX_INDEX = _build_prefix_index(configs)
+    _CONFIGURED_NAMES = frozenset(configs)
+    _ROUTER_CONFIGS = configs
+    return configs
+
+
+def get_router_configs() -> Dict[str, RouterConfig]:
+    """Get the live router configuration map, discovering routers on first use."""
+    if _ROUTER_CONFIGS is None:
+        return _load_router_configs()
+    return _ROUTER_CONFIGS
+
+
+def get_configured_router_names() -> FrozenSet[str]:
+    """Names of the configured routers, as a frozenset shared until the configs change."""
+    get_router_configs()
+    return _CONFIGURED_NAMES
+
+
+def __getattr__(name: str) -> Any:
+    # Compatibilidad: ROUTER_CONFIGS sigue disponible como atributo del módulo
+    if name == "ROUTER_CONFIGS":
+        return get_router_configs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def refresh_router_configs() -> None:
     """Refresh router configurations from discovery."""
-    global ROUTER_CONFIGS
-    ROUTER_CONFIGS = _get_dynamic_router_configs()
-    _validate_all_configs()
+    _load_router_configs()
     
     # Clear caches
-    get_enabled_routers.cache_clear()
     get_all_router_configs.cache_clear()
 
 
-@lru_cache(maxsize=1)
 def get_enabled_routers() -> List[str]:
-    enabled = [name for name, config in ROUTER_CONFIGS.items() if config.enabled]
-    return enabled
+    get_router_configs()
+    return list(_ENABLED_ROUTERS)
 
 
 def get_router_config(router_name: str) -> RouterConfig:
-    if router_name not in ROUTER_CONFIGS:
+    configs = get_router_configs()
+    if router_name not in configs:
         raise KeyError(f"Router '{router_name}' no encontrado")
     
-    return ROUTER_CONFIGS[router_name]
+    return configs[router_name]
 
 
 @lru_cache(maxsize=1)
 def get_all_router_configs() -> Dict[str, RouterConfig]:
-    return ROUTER_CONFIGS.copy()
+    return get_router_configs().copy()
 
 
 def add_router_config(
@@ -143,7 +172,9 @@ def add_router_config(
     Raises:
         ValueError: Si ya existe un router con ese nombre
     """
-    if name in ROUTER_CONFIGS:
+    global _CONFIGURED_NAMES, _ENABLED_ROUTERS
+    configs = get_router_configs()
+    if name in configs:
         raise ValueError(f"Router '{name}' ya existe")
     
     new_config = RouterConfig(
@@ -154,9 +185,14 @@ def add_router_config(
         enabled=enabled,
         version=version
     )
+    new_config._validate()
     
-    ROUTER_CONFIGS[name] = new_config
-    get_enabled_routers.cache_clear()
+    configs[name] = new_config
+    _CONFIGURED_NAMES = _CONFIGURED_NAMES | {name}
+    if enabled:
+        # Reconstruido desde las configuraciones para conservar su orden
+        _ENABLED_ROUTERS = _build_enabled_index(configs)
+    _PREFIX_INDEX.setdefault(new_config.prefix, name)
     get_all_router_configs.cache_clear()
 
 
@@ -170,10 +206,18 @@ def remove_router_config(name: str) -> None:
     Raises:
         KeyError: Si el router no existe
     """
-    if name not in ROUTER_CONFIGS:
+    global _PREFIX_INDEX, _CONFIGURED_NAMES
+    configs = get_router_configs()
+    if name not in configs:
         raise KeyError(f"Router '{name}' no encontrado")
     
-    del ROUTER_CONFIGS[name] 
+    removed = configs.pop(name)
+    _CONFIGURED_NAMES = _CONFIGURED_NAMES - {name}
+    _ENABLED_ROUTERS.pop(name, None)
+    if _PREFIX_INDEX.get(removed.prefix) == name:
+        # Otro router podría compartir el prefijo; reconstruir para conservar el orden
+        _PREFIX_INDEX = _build_prefix_index(configs)
+    get_all_router_configs.cache_clear()
 
 
 def update_router_config(
@@ -190,10 +234,12 @@ def update_router_config(
         KeyError: Si el router no existe
         ValueError: Si se intenta actualizar campos no permitidos
     """
-    if name not in ROUTER_CONFIGS:
+    global _ENABLED_ROUTERS
+    configs = get_router_configs()
+    if name not in configs:
         raise KeyError(f"Router '{name}' no encontrado")
     
-    config = ROUTER_CONFIGS[name]
+    config = configs[name]
     
     # Solo permitir actualizar ciertos campos
     allowed_fields = {'enabled', 'description', 'tags', 'version'}
@@ -202,6 +248,13 @@ def update_router_config(
             setattr(config, field, value)
         else:
             raise ValueError(f"No se puede actualizar el campo '{field}'")
+    
+    if 'enabled' in kwargs:
+        if config.enabled:
+            # Al re-habilitar, el router vuelve a su posición configurada (no al final)
+            _ENABLED_ROUTERS = _build_enabled_index(configs)
+        else:
+            _ENABLED_ROUTERS.pop(name, None)
 
 
 def get_router_by_prefix(prefix: str) -> Optional[str]:
@@ -213,7 +266,5 @@ def get_router_by_prefix(prefix: str) -> Optional[str]:
     Returns:
         Nombre del router o None si no se encuentra
     """
-    for name, config in ROUTER_CONFIGS.items():
-        if config.prefix == prefix:
-            return name
-    return None
+    get_router_configs()
+    return _PREFIX_INDEX.get(prefix)
@@ -1,7 +1,8 @@
 """Dynamic router discovery system.""" 
 import importlib 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from fastapi import APIRouter
 from app.core.logging import LoggerMixin
 
@@ -47,6 +48,11 @@ class RouterDiscovery(LoggerMixin):
     def __init__(self, controllers_path: str = "app.interfaces.api.controllers"):
         self.controllers_path = controllers_path
         self._discovered_routers: Dict[str, RouterMetadata] = {}
+        # Read-only views handed to callers instead of per-call copies
+        self._discovered_view: Mapping[str, RouterMetadata] = MappingProxyType(self._discovered_routers)
+        self._enabled_view: Mapping[str, RouterMetadata] = MappingProxyType({})
+        # Incrementado en cada refresh; permite a los consumidores invalidar cachés derivadas
+        self._discovery_version: int = 0
         self._scan_controllers()
     
     def _scan_controllers(self) -> None:
@@ -68,6 +74,12 @@ class RouterDiscovery(LoggerMixin):
                 
                 self._process_controller_file(file_path)
             
+            self._enabled_view = MappingProxyType({
+                name: metadata
+                for name, metadata in self._discovered_routers.items()
+                if metadata.enabled
+            })
+            
             self.log_info(
                 "Descubrimiento de routers completado",
                 total_routers=len(self._discovered_routers),
@@ -115,21 +127,20 @@ class RouterDiscovery(LoggerMixin):
     
     def _find_router_in_module(self, module: Any, module_name: str) -> Optional[APIRouter]:
         """Find router instance in module."""
+        namespace = vars(module)
+        
         # Look for common router variable names
         router_names = ["router", f"{module_name}_router", "api_router"]
         
         for router_name in router_names:
-            if hasattr(module, router_name):
-                router = getattr(module, router_name)
-                if isinstance(router, APIRouter):
-                    return router
+            router = namespace.get(router_name)
+            if isinstance(router, APIRouter):
+                return router
         
-        # Look for any APIRouter instance in module attributes
-        for attr_name in dir(module):
-            if not attr_name.startswith("_"):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, APIRouter):
-                    return attr
+        # Fallback: scan the module namespace directly (no dir() sort / getattr)
+        for attr_name, attr in namespace.items():
+            if type(attr) is APIRouter and not attr_name.startswith("_"):
+                return attr
         
         return None
     
@@ -179,26 +190,28 @@ class RouterDiscovery(LoggerMixin):
             version=version
         )
     
-    def get_discovered_routers(self) -> Dict[str, RouterMetadata]:
-        """Get all discovered routers."""
-        return self._discovered_routers.copy()
+    def get_discovered_routers(self) -> Mapping[str, RouterMetadata]:
+        """Get all discovered routers (read-only view)."""
+        return self._discovered_view
     
     def get_router_by_name(self, name: str) -> Optional[RouterMetadata]:
         """Get router metadata by name."""
         return self._discovered_routers.get(name)
     
-    def get_enabled_routers(self) -> Dict[str, RouterMetadata]:
-        """Get only enabled routers."""
-        return {
-            name: metadata 
-            for name, metadata in self._discovered_routers.items() 
-            if metadata.enabled
-        }
+    def get_enabled_routers(self) -> Mapping[str, RouterMetadata]:
+        """Get only enabled routers (read-only view, rebuilt on each scan)."""
+        return self._enabled_view
+    
+    @property
+    def discovery_version(self) -> int:
+        """Version of the discovered router set, bumped on every refresh."""
+        return self._discovery_version
     
     def refresh_discovery(self) -> None:
         """Refresh router discovery."""
         self._discovered_routers.clear()
         self._scan_controllers()
+        self._discovery_version += 1
         self.log_info("Descubrimiento de routers actualizado")
     
     def get_discovery_status(self) -> Dict[str, Any]:
@@ -216,25 +229,29 @@ class RouterDiscovery(LoggerMixin):
         }
 
 
-# Global discovery instance
-_router_discovery = RouterDiscovery()
+# Global discovery instance (created on first use so importing this module
+# does not import every controller)
+_router_discovery: Optional[RouterDiscovery] = None
 
 
 def get_router_discovery() -> RouterDiscovery:
     """Get the global router discovery instance."""
+    global _router_discovery
+    if _router_discovery is None:
+        _router_discovery = RouterDiscovery()
     return _router_discovery
 
 
 def refresh_router_discovery() -> None:
     """Refresh the global router discovery."""
-    _router_discovery.refresh_discovery()
+    get_router_discovery().refresh_discovery()
 
 
-def get_discovered_routers() -> Dict[str, RouterMetadata]:
+def get_discovered_routers() -> Mapping[str, RouterMetadata]:
     """Get all discovered routers."""
-    return _router_discovery.get_discovered_routers()
+    return get_router_discovery().get_discovered_routers()
 
 
-def get_enabled_routers() -> Dict[str, RouterMetadata]:
+def get_enabled_routers() -> Mapping[str, RouterMetadata]:
     """Get only enabled routers."""
-    return _router_discovery.get_enabled_routers()
+    return get_router_discovery().get_enabled_routers()
@@ -1,20 +1,30 @@
 """Router factory for dynamic router creation based on configuration."""
 
-from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
 
 from app.core.logging import LoggerMixin
-from .router_config import ROUTER_CONFIGS, get_enabled_routers, refresh_router_configs
+from .router_config import (
+    get_configured_router_names,
+    get_enabled_routers,
+    get_router_configs,
+    refresh_router_configs,
+)
 from .router_discovery import get_router_discovery, get_enabled_routers as get_discovered_enabled_routers
 
 
 class RouterFactory(LoggerMixin):
     def __init__(self):
         self.discovery = get_router_discovery()
-        self._validate_configuration()
+        # Resultados de introspección memoizados por versión de discovery (+ routers configurados);
+        # se guardan inmutables porque se entregan tal cual a todos los llamadores
+        self._validation_cache: Optional[Tuple[Tuple[int, FrozenSet[str]], Mapping[str, Any]]] = None
+        self._implemented_cache: Optional[Tuple[int, Tuple[str, ...]]] = None
         self._main_router: Optional[APIRouter] = None
+        self._validate_configuration()
     
     def _validate_configuration(self) -> None:
         try:
@@ -55,19 +65,21 @@ class RouterFactory(LoggerMixin):
             total_routers_enabled=len(enabled_routers)
         )
         
+        info_enabled = self.info_enabled
+        
         # Incluir solo los routers habilitados y descubiertos
         for router_name, metadata in enabled_routers.items():
             try:
-                # Los routers ya tienen su propio prefijo definido, no duplicar
-                self._main_router.include_router(
-                    metadata.router_instance
-                ) 
-                self.log_info(
-                    "Router incluido exitosamente", 
-                    router_name=router_name,
-                    prefix=metadata.prefix,
-                    tags=metadata.tags
-                )
+                # Las rutas de cada controller ya llevan su prefijo, tags y dependencias;
+                # se agregan directamente para evitar el re-análisis de include_router
+                self._main_router.routes.extend(metadata.router_instance.routes)
+                if info_enabled:
+                    self.log_info(
+                        "Router incluido exitosamente", 
+                        router_name=router_name,
+                        prefix=metadata.prefix,
+                        tags=metadata.tags
+                    )
             except Exception as e:
                 self.log_error(
                     "Error al incluir router",
@@ -82,45 +94,87 @@ class RouterFactory(LoggerMixin):
         metadata = self.discovery.get_router_by_name(router_name)
         return metadata.router_instance if metadata else None
     
-    def get_all_implemented_routers(self) -> List[str]:
-        return list(self.discovery.get_discovered_routers().keys())
+    def get_all_implemented_routers(self) -> Tuple[str, ...]:
+        version = self.discovery.discovery_version
+        if self._implemented_cache is None or self._implemented_cache[0] != version:
+            self._implemented_cache = (version, tuple(self.discovery.get_discovered_routers()))
+        return self._implemented_cache[1]
     
-    def get_missing_implementations(self) -> List[str]:
-        configured = set(ROUTER_CONFIGS.keys())
-        implemented = set(self.discovery.get_discovered_routers().keys())
-        return list(configured - implemented)
+    def get_missing_implementations(self) -> Tuple[str, ...]:
+        return self.validate_router_configuration()["missing_implementations"]
     
-    def validate_router_configuration(self) -> Dict[str, Any]:
-        configured = set(ROUTER_CONFIGS.keys())
+    def validate_router_configuration(self) -> Mapping[str, Any]:
+        """Validate configured vs implemented routers (memoized until discovery or configs change)."""
+        key = (self.discovery.discovery_version, get_configured_router_names())
+        if self._validation_cache is not None and self._validation_cache[0] == key:
+            return self._validation_cache[1]
+        
+        configured = key[1]
         implemented = set(self.discovery.get_discovered_routers().keys())
         
-        missing = list(configured - implemented)
-        extra = list(implemented - configured)
+        missing = tuple(configured - implemented)
+        extra = tuple(implemented - configured)
         
-        return {
+        validation = MappingProxyType({
             "valid": len(missing) == 0 and len(extra) == 0,
             "missing_implementations": missing,
             "extra_implementations": extra,
             "total_configured": len(configured),
             "total_implemented": len(implemented)
-        }
+        })
+        self._validation_cache = (key, validation)
+        return validation
     
     def clear_cache(self) -> None:
         self._main_router = None
+        self._validation_cache = None
+        self._implemented_cache = None
         self.log_debug("Caché del router principal limpiado")
 
 
-# Instancia singleton del factory
-_router_factory = RouterFactory()
+# Instancia singleton del factory (creada en el primer uso, no al importar el módulo)
+_router_factory: Optional[RouterFactory] = None
+
+
+def get_router_factory() -> RouterFactory:
+    """Get the global router factory instance."""
+    global _router_factory
+    if _router_factory is None:
+        _router_factory = RouterFactory()
+    return _router_factory
+
+
+# Router principal ya ensamblado (se asigna una sola vez; ver clear_router_cache)
+_MAIN_ROUTER: Optional[APIRouter] = None
 
 
-@lru_cache(maxsize=1)
 def create_api_router() -> APIRouter: 
-    return _router_factory.create_main_router()
+    global _MAIN_ROUTER
+    if _MAIN_ROUTER is None:
+        _MAIN_ROUTER = get_router_factory().create_main_router()
+    return _MAIN_ROUTER
+
+
+def mount_api_router(app: FastAPI, router: APIRouter) -> None:
+    """
+    Attach the routes of ``router`` to ``app`` without ``include_router``.
+    
+    Routes are appended as-is and bound to the app's dependency overrides,
+    so they are not cloned and re-analysed a second time.
+    """
+    for route in router.routes:
+        if isinstance(route, APIRoute):
+            route.dependency_overrides_provider = app
+    app.router.routes.extend(router.routes)
+    if app.middleware_stack is not None:
+        # App already served requests (dev reload): rebuild so the new routes are used
+        app.middleware_stack = app.build_middleware_stack()
 
 
 def get_router_status() -> Dict[str, Any]:
-    discovery_status = _router_factory.discovery.get_discovery_status()
+    factory = get_router_factory()
+    discovery_status = factory.discovery.get_discovery_status()
+    validation = factory.validate_router_configuration()
     
     return {
         "configuration": {name: {
@@ -130,28 +184,34 @@ def get_router_status() -> Dict[str, Any]:
             "description": config.description,
             "enabled": config.enabled,
             "version": config.version
-        } for name, config in ROUTER_CONFIGS.items()},
-        "implementations": _router_factory.get_all_implemented_routers(),
-        "validation": _router_factory.validate_router_configuration(),
+        } for name, config in get_router_configs().items()},
+        "implementations": list(factory.get_all_implemented_routers()),
+        "validation": {
+            **validation,
+            "missing_implementations": list(validation["missing_implementations"]),
+            "extra_implementations": list(validation["extra_implementations"])
+        },
         "enabled": get_enabled_routers(),
         "discovery": discovery_status,
         "cache_status": {
-            "main_router_cached": _router_factory._main_router is not None
+            "main_router_cached": factory._main_router is not None
         }
     }
 
 
 def clear_router_cache() -> None:
     """Clear the router cache to force recreation."""
-    _router_factory.clear_cache()
-    create_api_router.cache_clear()
-    _router_factory.log_info("Caché de routers limpiado")
+    global _MAIN_ROUTER
+    factory = get_router_factory()
+    factory.clear_cache()
+    _MAIN_ROUTER = None
+    factory.log_info("Caché de routers limpiado")
 
 
 def reload_routers() -> APIRouter:
     """Reload all routers from discovery."""
     # Refresh discovery
-    _router_factory.discovery.refresh_discovery()
+    get_router_factory().discovery.refresh_discovery()
     
     # Refresh configurations
     refresh_router_configs()
@@ -1,25 +1,12 @@
-from typing import Annotated, AsyncGenerator
+from typing import Annotated
 from fastapi import Depends
 from app.application.use_cases import AgreementUseCases
 from app.domain.repositories import AgreementRepository as AgreementRepoInterface
 from app.infrastructure.repositories.agreement_repository import PostgresAgreementRepository
-from app.infrastructure.postgres.session import AsyncSessionLocal
+from app.interfaces.dependencies.session_dependencies import session_repository_dependency
 
-# Repositorio con manejo explícito de sesión
-async def get_agreement_repository() -> AsyncGenerator[AgreementRepoInterface, None]:
-    session = AsyncSessionLocal()
-    try:
-        repository =  PostgresAgreementRepository(session)
-        yield repository
-        # Auto-commit on successful completion
-        await session.commit()
-    except Exception:
-        # Auto-rollback on any exception
-        await session.rollback()
-        raise
-    finally:
-        # Ensure session is closed
-        await session.close()
+# Repositorio sobre la sesión de la petición (abierta por DbSessionMiddleware)
+get_agreement_repository = session_repository_dependency(PostgresAgreementRepository, "get_agreement_repository")
 
 # Use case que recibe el repositorio como dependencia
 async def get_agreement_use_cases(
@@ -1,33 +1,20 @@
 """Agreements bulk upload dependencies for FastAPI dependency injection."""
 
-from typing import Annotated, AsyncGenerator
+from typing import Annotated
 from fastapi import Depends
-from contextlib import asynccontextmanager
-from app.infrastructure.postgres.session import _db_manager
 from app.application.use_cases.agreements_bulk_upload_use_cases import AgreementsBulkUploadUseCases
 from app.domain.repositories.agreements_bulk_upload_repository import AgreementsBulkUploadRepository
 from app.infrastructure.repositories.agreements_bulk_upload_repository import (
     AgreementsBulkUploadRepository as AgreementsBulkUploadRepositoryImpl,
 )
 from app.core.utils import ExcelProcessing
+from app.interfaces.dependencies.session_dependencies import session_repository_dependency
 from app.interfaces.dependencies.sku_dependencies import SkuRepositoryDep
 
-async def get_bulk_upload_repository() -> AsyncGenerator[AgreementsBulkUploadRepository, None]:
-    """Get agreements bulk upload repository with transactional session."""  
-    async with _db_manager.AsyncSessionLocal() as session:
-        try:
-            repository = AgreementsBulkUploadRepositoryImpl(session)
-            yield repository
-            # Auto-commit on successful completion
-            await session.commit()
-        except Exception:
-            # Auto-rollback on any exception
-            await session.rollback()
-            raise
-        finally:
-            # Ensure session is closed
-            await session.close()
-        # Session auto-closes due to async context manager
+# Repositorio sobre la sesión de la petición (abierta por DbSessionMiddleware)
+get_bulk_upload_repository = session_repository_dependency(
+    AgreementsBulkUploadRepositoryImpl, "get_bulk_upload_repository"
+)
 
 
 def get_excel_processing_service() -> ExcelProcessing:
@@ -1,12 +1,14 @@
 """Authentication dependencies for FastAPI."""
 
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, TypeVar
 from fastapi import HTTPException, Header, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette import status
 
-from app.interfaces.schemas.security_schema import User, Roles
+from app.interfaces.schemas.security_schema import User, Roles, required_roles_mask
 from app.domain.repositories.user_permissions_repository import UserPermissionsRepository
 from app.domain.repositories.security_repository import SecurityContextRepository, AuthenticationStrategy
 from app.core.utils import get_bu_id
@@ -20,6 +22,8 @@ from app.infrastructure.repositories.user_permissions_repository import UserPerm
 from app.core.security_context import SecurityContext
 from app.core.keycloak_strategy import KeyCloakStrategy
 
+logger = logging.getLogger(__name__)
+
 
 def get_permissions_repository() -> UserPermissionsRepository:
     """
@@ -32,13 +36,22 @@ def get_permissions_repository() -> UserPermissionsRepository:
     return ConcreteUserPermissionsRepository(session)
 
 
+@lru_cache(maxsize=1)
+def _get_authentication_strategy() -> AuthenticationStrategy:
+    """
+    Shared authentication strategy.
+    KeyCloakStrategy is stateless, so a single instance serves every request.
+    """
+    return KeyCloakStrategy()
+
+
 def get_security_context() -> SecurityContextRepository:
     """
     Determine strategy for authentication and authorization.
     Uses dependency injection to provide implementations.
+    The context holds per-request token/user state, so only the strategy is shared.
     """
-    strategy: AuthenticationStrategy = KeyCloakStrategy()
-    context: SecurityContextRepository = SecurityContext(strategy)
+    context: SecurityContextRepository = SecurityContext(_get_authentication_strategy())
     return context
 
 
@@ -125,10 +138,28 @@ async def get_current_user(
     return await security(country, authorization)
 
 
+PermissionT = TypeVar("PermissionT", str, Roles)
+
+
+@lru_cache(maxsize=None)
+def _shared_permissions(permissions: Tuple[PermissionT, ...]) -> Tuple[PermissionT, ...]:
+    return permissions
+
+
+def _intern_permissions(permissions: Sequence[PermissionT]) -> Tuple[PermissionT, ...]:
+    """
+    De-duplicated, immutable permission tuple.
+    Routes declaring the same permissions share a single instance.
+    """
+    return _shared_permissions(tuple(dict.fromkeys(permissions)))
+
+
 def require_permissions(permissions: List[str]):
     """
     Dependency factory for permission checking.
     """
+    permissions = _intern_permissions(permissions)
+    
     async def check_permissions(
         country: str = Header(..., description="Country code"),
         authorization: str = Header(None, description="Bearer token")
@@ -143,28 +174,39 @@ def require_permissions_internal(permissions: List[Roles]):
     Dependency factory for internal permission checking (with DB validation).
     This handles DB internally without exposing it to the controller.
     """
+    permissions = _intern_permissions(permissions)
+    # Máscara calculada al registrar la ruta; un rol desconocido falla aquí, no en el request
+    required_mask = required_roles_mask(permissions)
+    
     async def check_permissions(request: Request) -> User:
-        # Get user from middleware
-        if not hasattr(request.state, 'user') or not request.state.user:
+        # Get user from middleware (AuthMiddleware sets it on every authenticated path)
+        user = getattr(request.state, "user", None)
+        if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not authenticated"
             )
         
-        user = request.state.user
-        
-        # Check database permissions using the simple function
-        await check_db_permissions_simple(user, permissions)
+        # Check database permissions reusing the request session (DbSessionMiddleware)
+        await check_db_permissions_simple(
+            user, permissions, getattr(request.state, "db_session", None), required_mask
+        )
         
         return user
     
     return check_permissions
 
 
-async def check_db_permissions_simple(user: User, permissions: List[Roles]) -> bool:
+async def check_db_permissions_simple(
+    user: User,
+    permissions: Sequence[Roles],
+    session: AsyncSession | None = None,
+    required_mask: Optional[int] = None
+) -> bool:
     """
     Simple function to check DB permissions.
-    Handles DB session internally.
+    Uses the given session (normally the request session); when none is
+    provided, a session is opened and closed internally.
     Raises HTTPException if permissions are not met.
     """
     if not user:
@@ -173,12 +215,15 @@ async def check_db_permissions_simple(user: User, permissions: List[Roles]) -> b
             detail="User not authenticated"
         )
     
-    # Create session for permissions check
-    session = AsyncSessionLocal()
+    # Solo se abre una sesión propia cuando no hay sesión de petición
+    if session is None:
+        async with AsyncSessionLocal() as own_session:
+            return await check_db_permissions_simple(user, permissions, own_session, required_mask)
+    
     try:
         permissions_repo = ConcreteUserPermissionsRepository(session)
-        logging.info(f'Checking DB permissions for user "{user.email}" with BU ID {user.bu_id}')
-        has_permission = await permissions_repo.check_db_permissions(user, permissions)
+        logger.info('Checking DB permissions for user "%s" with BU ID %s', user.email, user.bu_id)
+        has_permission = await permissions_repo.check_db_permissions(user, permissions, required_mask)
         
         if not has_permission:
             raise HTTPException(
@@ -195,8 +240,6 @@ async def check_db_permissions_simple(user: User, permissions: List[Roles]) -> b
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error checking permissions: {str(e)}"
         )
-    finally:
-        await session.close()
 
 
 async def check_db_permissions(
@@ -220,5 +263,6 @@ async def check_db_permissions(
             detail="User not authenticated"
         )
     
-    permissions_repo = get_permissions_repository()
-    return await permissions_repo.check_db_permissions(user, permissions)
+    async with AsyncSessionLocal() as session:
+        permissions_repo = ConcreteUserPermissionsRepository(session)
+        return await permissions_repo.check_db_permissions(user, permissions)
@@ -5,21 +5,25 @@ from fastapi.security import HTTPBearer
 from typing import Optional
 
 
-# Security scheme for Swagger UI
+# Security scheme for Swagger UI (HTTPBearer.__call__ is already a coroutine)
 security_scheme = HTTPBearer(
     scheme_name="Bearer Token",
     description="Enter your JWT token"
 )
 
 
-def get_country_header(
+async def get_country_header(
     country: str = Header(..., description="Country code (required)")
 ) -> str:
-    """Get country header dependency."""
+    """Get country header dependency.
+
+    Declared ``async`` so FastAPI runs it on the event loop instead of
+    dispatching it to the threadpool on every request.
+    """
     return country
 
 
-def get_auth_headers(
+async def get_auth_headers(
     country: str = Header(..., description="Country code (required)"),
     authorization: Optional[str] = Header(None, description="Bearer token for authentication")
 ) -> tuple[str, Optional[str]]:
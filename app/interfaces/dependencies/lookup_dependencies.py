@@ -1,25 +1,12 @@
-from typing import Annotated, AsyncGenerator
+from typing import Annotated
 from fastapi import Depends
 from app.application.use_cases.lookup_use_cases import LookupUseCases
 from app.domain.repositories.lookup_repository import LookupRepository as LookupRepoInterface
 from app.infrastructure.repositories.lookup_repository import PostgresLookupRepository
-from app.infrastructure.postgres.session import AsyncSessionLocal
+from app.interfaces.dependencies.session_dependencies import session_repository_dependency
 
-# Repositorio con manejo explícito de sesión
-async def get_lookup_repository() -> AsyncGenerator[LookupRepoInterface, None]:
-    session = AsyncSessionLocal()
-    try:
-        repository = PostgresLookupRepository(session)
-        yield repository
-        # Auto-commit on successful completion
-        await session.commit()
-    except Exception:
-        # Auto-rollback on any exception
-        await session.rollback()
-        raise
-    finally:
-        # Ensure session is closed
-        await session.close()
+# Repositorio sobre la sesión de la petición (abierta por DbSessionMiddleware)
+get_lookup_repository = session_repository_dependency(PostgresLookupRepository, "get_lookup_repository")
 
 # Use case que recibe el repositorio como dependencia
 async def get_lookup_use_cases(
@@ -6,6 +6,7 @@ This module contains all dependencies related to master data operations:
 - Type aliases for cleaner route signatures
 """
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
@@ -17,14 +18,21 @@ from app.infrastructure.repositories.master_data_repository import (
 )
 
 
+@lru_cache(maxsize=1)
+def _get_shared_master_data_repository() -> MasterDataRepository:
+    """Single BigQuery repository instance shared across requests."""
+    return MasterDataRepository()
+
+
 def get_master_data_repository() -> MasterDataRepository:
     """Factory function for MasterDataRepository.
 
     Uses BigQuery repository for master data. Application will fail if BigQuery is unavailable.
+    The repository is built once and reused (failures are not cached, so the next call retries).
     """
     try:
         # BigQuery connection validation could be added here
-        return MasterDataRepository()
+        return _get_shared_master_data_repository()
     except Exception as e:
         # En caso de error, lanzar excepción para que la aplicación falle
         raise Exception(f"Failed to initialize BigQuery master data repository: {e}")
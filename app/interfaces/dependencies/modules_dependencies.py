@@ -1,29 +1,16 @@
 """Module dependencies for FastAPI dependency injection."""
 
-from typing import Annotated, AsyncGenerator
+from typing import Annotated
 
 from fastapi import Depends
 
 from app.application.use_cases.modules_use_cases import ModulesUseCases
 from app.domain.repositories.modules_repository import ModulesRepository as ModulesRepoInterface
 from app.infrastructure.repositories.modules_repository import ModulesRepository as ConcreteModulesRepository
-from app.infrastructure.postgres.session import AsyncSessionLocal
+from app.interfaces.dependencies.session_dependencies import session_repository_dependency
 
-# Repositorio con manejo explícito de sesión
-async def get_module_repository() -> AsyncGenerator[ModulesRepoInterface, None]:
-    session = AsyncSessionLocal()
-    try:
-        repository = ConcreteModulesRepository(session)
-        yield repository
-        # Auto-commit on successful completion
-        await session.commit()
-    except Exception:
-        # Auto-rollback on any exception
-        await session.rollback()
-        raise
-    finally:
-        # Ensure session is closed
-        await session.close()
+# Repositorio sobre la sesión de la petición (abierta por DbSessionMiddleware)
+get_module_repository = session_repository_dependency(ConcreteModulesRepository, "get_module_repository")
 
 # Use case que recibe el repositorio como dependencia
 async def get_module_use_cases(
@@ -0,0 +1,29 @@
+"""Shared factory for repository dependencies bound to the request DB session."""
+
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import Request
+
+RepositoryT = TypeVar("RepositoryT")
+
+
+def session_repository_dependency(
+    repository_cls: Callable[[Any], RepositoryT],
+    name: str,
+) -> Callable[[Request], Awaitable[RepositoryT]]:
+    """
+    Build a dependency returning ``repository_cls`` over the request session.
+
+    The session is opened, committed/rolled back and closed by DbSessionMiddleware.
+    Each generated callable gets its own ``__name__``/``__qualname__`` so routes,
+    OpenAPI and ``dependency_overrides`` can tell them apart.
+
+    Args:
+        repository_cls: Repository implementation taking an AsyncSession
+        name: Public name of the dependency (e.g. ``get_store_repository``)
+    """
+    async def dependency(request: Request) -> RepositoryT:
+        return repository_cls(request.state.db_session)
+
+    dependency.__name__ = dependency.__qualname__ = name
+    return dependency
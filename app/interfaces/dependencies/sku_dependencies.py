@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends
 from app.domain.repositories.sku_repository import SkuRepository
@@ -5,6 +6,8 @@ from app.application.use_cases.sku_use_cases import SkuUseCases
 from app.infrastructure.repositories.sku_repository import SkuRepository as SkuRepositoryImpl
 
 
+# Una sola instancia (cliente BigQuery incluido) para todas las peticiones
+@lru_cache(maxsize=1)
 def get_sku_repository() -> SkuRepository:
     return SkuRepositoryImpl()
 
@@ -1,25 +1,12 @@
-from typing import Annotated, AsyncGenerator
+from typing import Annotated
 from fastapi import Depends
 from app.application.use_cases import StoresUseCases
 from app.domain.repositories import StoresRepository as StoresRepoInterface
 from app.infrastructure.repositories import StoresRepository as PostgresStoresRepo
-from app.infrastructure.postgres.session import AsyncSessionLocal
+from app.interfaces.dependencies.session_dependencies import session_repository_dependency
 
-# Repositorio con manejo explícito de sesión
-async def get_store_repository() -> AsyncGenerator[StoresRepoInterface, None]:
-    session = AsyncSessionLocal()
-    try:
-        repository = PostgresStoresRepo(session)
-        yield repository
-        # Auto-commit on successful completion
-        await session.commit()
-    except Exception:
-        # Auto-rollback on any exception
-        await session.rollback()
-        raise
-    finally:
-        # Ensure session is closed
-        await session.close()
+# Repositorio sobre la sesión de la petición (abierta por DbSessionMiddleware)
+get_store_repository = session_repository_dependency(PostgresStoresRepo, "get_store_repository")
 
 # Use case que recibe el repositorio como dependencia
 async def get_store_use_cases(
@@ -1,126 +1,95 @@
-"""Pydantic schemas for request/response validation."""
+"""Pydantic schemas for request/response validation.
 
-from .lookup_schema import LookupCategoryCodeSchema, LookupOptionValueSchema
-from .module_schema import (
-    ActiveModuleUsersResponse,
-    ModuleIdRequest,
-    ModuleSchema,
-    ModulesResponse,
-    ModuleUserSchema,
-    ModuleUsersResponse,
-)
-from ...core.response import (
-    BaseResponse,
-    ErrorResponse,
-    PaginatedResponse,
-    SuccessResponse,
-    create_error_response,
-    create_paginated_response,
-    create_success_response,
-)
-from .stores_schema import StoreResponse
-# Agreement schemas separated by domain
-from .agreement_schema import (
-    # Main agreement schemas
-    AgreementSearchRequest,
-    AgreementCreateRequest,
-    AgreementUpdateRequest,
-    AgreementCreateResponse,
-    AgreementCreateSuccessResponse,
-    AgreementSearchResponse,
-    AgreementSearchResultItem,
-    AgreementResponse,
-)
-from .agreement_product_schema import (
-    # Product schemas
-    AgreementProductCreateRequest,
-    AgreementProductCreateResponse,
-    AgreementProductResponse,
-)
-from .agreement_store_rule_schema import (
-    # Store rule schemas
-    AgreementStoreRuleCreateRequest,
-    AgreementStoreRuleCreateResponse,
-    AgreementStoreRuleResponse,
-)
-from .agreement_excluded_flag_schema import (
-    # Excluded flag schemas
-    AgreementExcludedFlagCreateRequest,
-    AgreementExcludedFlagCreateResponse,
-    AgreementExcludedFlagResponse,
-)
-from app.core.validators import UnifiedValidator, validate_secure_string, validate_secure_string_advanced, validate_with_timing_protection 
-from .sku_schema import SkuCodesRequest, SkuResponse, SkusResponse
+Public names are resolved lazily (PEP 562): each schema module is imported,
+and its pydantic models built, the first time one of its names is accessed.
+"""
 
-from ...domain.entities.agreement import Agreement
-from ...domain.entities.sku import Sku
-from ...core.agreement_enums import SourceSystemEnum, StoreRuleStatusEnum
-from ...domain.entities.agreement_excluded_flag import AgreementExcludedFlag
-from ...domain.entities.agreement_product import AgreementProduct
-from ...domain.entities.agreement_store_rule import AgreementStoreRule
-from ...domain.entities.division import Division
-from ...domain.entities.lookup import LookupValueResult
-from ...domain.entities.module import Module
-from ...domain.entities.stores import Stores
+from importlib import import_module
+from typing import Any, Dict, List, Tuple
 
-__all__ = [
+# Nombre público -> módulo (relativo a este paquete) que lo define
+_LAZY_IMPORTS = {
     # Lookup schemas
-    "LookupCategoryCodeSchema",
-    "LookupOptionValueSchema",
+    "LookupCategoryCodeSchema": ".lookup_schema",
+    "LookupOptionValueSchema": ".lookup_schema",
     # Module schemas
-    "ActiveModuleUsersResponse",
-    "ModuleIdRequest",
-    "ModuleSchema",
-    "ModulesResponse",
-    "ModuleUserSchema",
-    "ModuleUsersResponse",
+    "ActiveModuleUsersResponse": ".module_schema",
+    "ModuleIdRequest": ".module_schema",
+    "ModuleSchema": ".module_schema",
+    "ModulesResponse": ".module_schema",
+    "ModuleUserSchema": ".module_schema",
+    "ModuleUsersResponse": ".module_schema",
     # Response schemas
-    "BaseResponse",
-    "ErrorResponse",
-    "PaginatedResponse",
-    "SuccessResponse",
-    "create_error_response",
-    "create_paginated_response",
-    "create_success_response",
+    "BaseResponse": "...core.response",
+    "ErrorResponse": "...core.response",
+    "PaginatedResponse": "...core.response",
+    "SuccessResponse": "...core.response",
+    "create_error_response": "...core.response",
+    "create_paginated_response": "...core.response",
+    "create_success_response": "...core.response",
     # Store schemas
-    "StoreResponse",
-    # Agreement schemas (unified)
-    "AgreementSearchRequest",
-    "AgreementCreateRequest",
-    "AgreementUpdateRequest",
-    "AgreementProductCreateRequest",
-    "AgreementStoreRuleCreateRequest",
-    "AgreementExcludedFlagCreateRequest",
-    "AgreementCreateResponse",
-    "AgreementProductCreateResponse",
-    "AgreementStoreRuleCreateResponse",
-    "AgreementExcludedFlagCreateResponse",
-    "AgreementCreateSuccessResponse",
-    "AgreementSearchResponse",
-    "AgreementSearchResultItem",
-    "AgreementResponse",
-    "AgreementProductResponse",
-    "AgreementStoreRuleResponse",
-    "AgreementExcludedFlagResponse",
-    # Validator schemas
-    "UnifiedValidator",
-    "validate_secure_string",
-    "validate_secure_string_advanced",
-    "validate_with_timing_protection",
+    "StoreResponse": ".stores_schema",
+    # Agreement schemas (separated by domain)
+    "AgreementSearchRequest": ".agreement_schema",
+    "AgreementCreateRequest": ".agreement_schema",
+    "AgreementUpdateRequest": ".agreement_schema",
+    "AgreementCreateResponse": ".agreement_schema",
+    "AgreementCreateSuccessResponse": ".agreement_schema",
+    "AgreementSearchResponse": ".agreement_schema",
+    "AgreementSearchResultItem": ".agreement_schema",
+    "AgreementResponse": ".agreement_schema",
+    "AgreementProductCreateRequest": ".agreement_product_schema",
+    "AgreementProductCreateResponse": ".agreement_product_schema",
+    "AgreementProductResponse": ".agreement_product_schema",
+    "PRODUCT_LIST_ADAPTER": ".agreement_product_schema",
+    "AgreementStoreRuleCreateRequest": ".agreement_store_rule_schema",
+    "AgreementStoreRuleCreateResponse": ".agreement_store_rule_schema",
+    "AgreementStoreRuleResponse": ".agreement_store_rule_schema",
+    "AgreementExcludedFlagCreateRequest": ".agreement_excluded_flag_schema",
+    "AgreementExcludedFlagCreateResponse": ".agreement_excluded_flag_schema",
+    "AgreementExcludedFlagResponse": ".agreement_excluded_flag_schema",
+    "EXCLUDED_FLAG_LIST_ADAPTER": ".agreement_excluded_flag_schema",
     # SKU schemas
-    "SkuCodesRequest",
-    "SkuResponse",
-    "SkusResponse",
-    # Domain entities
-    "Agreement",
-    "SourceSystemEnum",
-    "StoreRuleStatusEnum",
-    "AgreementExcludedFlag",
-    "AgreementProduct",
-    "AgreementStoreRule",
-    "Division",
-    "LookupValueResult",
-    "Module",
-    "Stores",
-    "Sku",
-]
+    "SkuCodesRequest": ".sku_schema",
+    "SkuResponse": ".sku_schema",
+    "SkusResponse": ".sku_schema",
+    # Domain entities and enums
+    "Agreement": "...domain.entities.agreement",
+    "Sku": "...domain.entities.sku",
+    "SourceSystemEnum": "...core.agreement_enums",
+    "StoreRuleStatusEnum": "...core.agreement_enums",
+    "AgreementExcludedFlag": "...domain.entities.agreement_excluded_flag",
+    "AgreementProduct": "...domain.entities.agreement_product",
+    "AgreementStoreRule": "...domain.entities.agreement_store_rule",
+    "Division": "...domain.entities.division",
+    "LookupValueResult": "...domain.entities.lookup",
+    "Module": "...domain.entities.module",
+    "Stores": "...domain.entities.stores",
+}
+
+__all__ = tuple(_LAZY_IMPORTS)
+
+
+# Módulo -> nombres que exporta, para enlazarlos todos con una sola importación
+_MODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    module_name: tuple(name for name, owner in _LAZY_IMPORTS.items() if owner == module_name)
+    for module_name in set(_LAZY_IMPORTS.values())
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = import_module(module_name, __package__)
+    # Cache en el módulo: los siguientes accesos (también a los nombres hermanos)
+    # no vuelven a pasar por __getattr__
+    namespace = globals()
+    for sibling in _MODULE_EXPORTS[module_name]:
+        namespace[sibling] = getattr(module, sibling)
+    return namespace[name]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,59 +1,62 @@
 """Agreement Excluded Flag Pydantic schemas for validation and responses."""
 
-from datetime import date, datetime
-from decimal import Decimal
-from typing import List, Optional
+from typing import Annotated, List
 
 from app.core.validators import validate_secure_string_advanced
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
-    field_serializer,
+    StringConstraints,
+    TypeAdapter,
+    ValidationInfo,
     field_validator,
 )
 
+from .common_schema import DEFERRED_RESPONSE_CONFIG, REQUEST_CONFIG, IsoDatetime, list_adapter
+
+# Caracteres permitidos, validados por pydantic-core (Rust) antes de los validadores Python
+_ALNUM_WS_PATTERN = r'^[a-zA-Z0-9\-_\s]+$'
+_ALNUM_PATTERN = r'^[a-zA-Z0-9\-_]+$'
+
+_AlnumWsStr = Annotated[str, StringConstraints(strip_whitespace=True, pattern=_ALNUM_WS_PATTERN)]
+_AlnumStr = Annotated[str, StringConstraints(strip_whitespace=True, pattern=_ALNUM_PATTERN)]
+
+# Nombre mostrado en los mensajes de error por campo
+_FLAG_FIELD_LABELS = {"flag_type": "Flag type", "flag_value": "Flag value"}
+
 
 #region Base Schemas
 
 class AgreementExcludedFlagBase(BaseModel):
     """Base schema for agreement excluded flag data."""
     
-    flag_type: str = Field(
+    flag_type: _AlnumWsStr = Field(
         ...,
         min_length=1,
         max_length=50,
         description="Flag type (1-50 characters)"
     )
-    flag_value: str = Field(
+    flag_value: _AlnumWsStr = Field(
         ...,
         min_length=1,
         max_length=100,
         description="Flag value (1-100 characters)"
     )
 
-    @field_validator('flag_type')
+    @field_validator('flag_type', 'flag_value')
     @classmethod
-    def validate_flag_type(cls, v: str) -> str:
+    def validate_flag_fields(cls, v: str, info: ValidationInfo) -> str:
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
-            field_name="Flag type",
+            field_name=_FLAG_FIELD_LABELS[info.field_name],
             max_repeated_chars=3,
             normalize_whitespace=True,
             to_upper=False
         )
 
-    @field_validator('flag_value')
-    @classmethod
-    def validate_flag_value(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
-            field_name="Flag value",
-            max_repeated_chars=3,
-            normalize_whitespace=True,
-            to_upper=False
-        )
+    # No se valida directamente en ningún endpoint: construir el schema solo si se usa
+    model_config = ConfigDict(defer_build=True)
 
 #endregion
 
@@ -63,7 +66,7 @@ class AgreementExcludedFlagBase(BaseModel):
 class AgreementExcludedFlagCreateRequest(BaseModel):
     """Schema for creating agreement excluded flags."""
     
-    excluded_flag_id: str = Field(
+    excluded_flag_id: _AlnumStr = Field(
         ...,
         min_length=1,
         max_length=20,
@@ -75,46 +78,58 @@ class AgreementExcludedFlagCreateRequest(BaseModel):
     def validate_excluded_flag_id(cls, v: str) -> str:
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
             field_name="Excluded flag ID",
             max_repeated_chars=3,
             normalize_whitespace=False,
             to_upper=False
         )
 
+    model_config = REQUEST_CONFIG
+
+
+EXCLUDED_FLAG_LIST_ADAPTER: TypeAdapter[List[AgreementExcludedFlagCreateRequest]] = list_adapter(
+    AgreementExcludedFlagCreateRequest
+)
+
 #endregion
 
 
 #region Response Schemas
 
-class AgreementExcludedFlagResponse(BaseModel):
-    """Response schema for agreement excluded flags."""
+class _AgreementExcludedFlagFieldsMixin(BaseModel):
+    """Fields shared by the agreement excluded flag response schemas."""
     
-    id: Optional[int] = None
+    id: int | None = None
     agreement_id: int
     excluded_flag_id: str
     active: bool
-    created_at: Optional[str] = None
+    created_at: IsoDatetime | None = None
     created_by_user_email: str
-    updated_status_by_user_email: Optional[str] = None
-    updated_at: Optional[str] = None
-    excluded_flag_name: Optional[str] = None
+    updated_status_by_user_email: str | None = None
+    updated_at: IsoDatetime | None = None
+
+    model_config = DEFERRED_RESPONSE_CONFIG
+
 
-    model_config = {"from_attributes": True}
+class AgreementExcludedFlagResponse(_AgreementExcludedFlagFieldsMixin):
+    """Response schema for agreement excluded flags."""
+    
+    excluded_flag_name: str | None = None
 
 
 class AgreementExcludedFlagCreateResponse(BaseModel):
     """Response schema for created agreement excluded flags."""
     
+    # Sin el mixin: el contrato publica updated_at antes de updated_status_by_user_email
     id: int
     agreement_id: int
     excluded_flag_id: str
     active: bool
-    created_at: str
+    created_at: IsoDatetime
     created_by_user_email: str
-    updated_at: str
-    updated_status_by_user_email: Optional[str] = None
+    updated_at: IsoDatetime
+    updated_status_by_user_email: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = DEFERRED_RESPONSE_CONFIG
 
 #endregion
@@ -1,123 +1,123 @@
 """Agreement Product Pydantic schemas for validation and responses."""
 
-from datetime import date, datetime
-from decimal import Decimal
-from typing import List, Optional
+from typing import Annotated, List
 
 from app.core.validators import validate_secure_string_advanced
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    ConfigDict,
     Field,
-    field_serializer,
-    field_validator,
+    StringConstraints,
+    TypeAdapter,
 )
 
+from .common_schema import DEFERRED_RESPONSE_CONFIG, REQUEST_CONFIG, IsoDatetime, list_adapter
+
+# Caracteres permitidos, validados por pydantic-core (Rust) antes del validador Python
+_SKU_CODE_PATTERN = r'^[a-zA-Z0-9\-_\.]+$'
+
+
+def _validate_sku_code(v: str) -> str:
+    return validate_secure_string_advanced(
+        value=v,
+        field_name="SKU code",
+        max_repeated_chars=3,
+        normalize_whitespace=False,
+        to_upper=False
+    )
+
+
+# _SkuCodeStr | None resuelve None en pydantic-core: el validador solo corre con un SKU real
+_SkuCodeStr = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=50, pattern=_SKU_CODE_PATTERN),
+    AfterValidator(_validate_sku_code),
+]
+
+# Tipos reutilizados por los campos de jerarquía, marca y proveedor
+_Code20Str = Annotated[str, StringConstraints(max_length=20)]
+_Name100Str = Annotated[str, StringConstraints(max_length=100)]
+_Text255Str = Annotated[str, StringConstraints(max_length=255)]
+_SupplierId = Annotated[int, Field(gt=0, le=999_999_999)]
+
 
 #region Base Schemas
 
 class AgreementProductBase(BaseModel):
     """Base schema for agreement product data."""
     
-    sku_code: Optional[str] = Field(
+    sku_code: _SkuCodeStr | None = Field(
         None,
-        max_length=50,
         description="SKU code (max 50 characters)"
     )
-    sku_description: Optional[str] = Field(
+    sku_description: _Text255Str | None = Field(
         None,
-        max_length=255,
         description="SKU description (max 255 characters)"
     )
-    division_code: Optional[str] = Field(
+    division_code: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Division code (max 20 characters)"
     )
-    division_name: Optional[str] = Field(
+    division_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Division name (max 100 characters)"
     )
-    department_code: Optional[str] = Field(
+    department_code: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Department code (max 20 characters)"
     )
-    department_name: Optional[str] = Field(
+    department_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Department name (max 100 characters)"
     )
-    subdepartment_code: Optional[str] = Field(
+    subdepartment_code: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Subdepartment code (max 20 characters)"
     )
-    subdepartment_name: Optional[str] = Field(
+    subdepartment_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Subdepartment name (max 100 characters)"
     )
-    class_code: Optional[str] = Field(
+    class_code: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Class code (max 20 characters)"
     )
-    class_name: Optional[str] = Field(
+    class_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Class name (max 100 characters)"
     )
-    subclass_code: Optional[str] = Field(
+    subclass_code: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Subclass code (max 20 characters)"
     )
-    subclass_name: Optional[str] = Field(
+    subclass_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Subclass name (max 100 characters)"
     )
-    brand_id: Optional[str] = Field(
+    brand_id: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Brand ID (max 20 characters)"
     )
-    brand_name: Optional[str] = Field(
+    brand_name: _Name100Str | None = Field(
         None,
-        max_length=100,
         description="Brand name (max 100 characters)"
     )
-    supplier_id: Optional[int] = Field(
+    supplier_id: _SupplierId | None = Field(
         None,
-        gt=0,
-        le=999999999,
         description="Supplier ID (1-999999999)"
     )
-    supplier_name: Optional[str] = Field(
+    supplier_name: _Text255Str | None = Field(
         None,
-        max_length=255,
         description="Supplier name (max 255 characters)"
     )
-    supplier_ruc: Optional[str] = Field(
+    supplier_ruc: _Code20Str | None = Field(
         None,
-        max_length=20,
         description="Supplier RUC"
     )
 
-    @field_validator('sku_code')
-    @classmethod
-    def validate_sku_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.]+$',
-            field_name="SKU code",
-            max_repeated_chars=3,
-            normalize_whitespace=False,
-            to_upper=False
-        )
+    # Solo se usa como base: su validador no se construye salvo uso directo
+    model_config = ConfigDict(defer_build=True)
 
 #endregion
 
@@ -126,72 +126,60 @@ class AgreementProductBase(BaseModel):
 
 class AgreementProductCreateRequest(AgreementProductBase):
     """Schema for creating agreement products."""
-    pass
+    
+    model_config = REQUEST_CONFIG
+
+
+PRODUCT_LIST_ADAPTER: TypeAdapter[List[AgreementProductCreateRequest]] = list_adapter(
+    AgreementProductCreateRequest
+)
 
 #endregion
 
 
 #region Response Schemas
 
-class AgreementProductResponse(BaseModel):
-    """Response schema for agreement products."""
+class _AgreementProductFieldsMixin(BaseModel):
+    """Fields shared by the agreement product response schemas."""
     
-    id: Optional[int] = None
+    id: int | None = None
     agreement_id: int
-    sku_code: Optional[str] = None
-    sku_description: Optional[str] = None
-    division_code: Optional[str] = None
-    division_name: Optional[str] = None
-    department_code: Optional[str] = None
-    department_name: Optional[str] = None
-    subdepartment_code: Optional[str] = None
-    subdepartment_name: Optional[str] = None
-    class_code: Optional[str] = None
-    class_name: Optional[str] = None
-    subclass_code: Optional[str] = None
-    subclass_name: Optional[str] = None
-    brand_id: Optional[str] = None
-    brand_name: Optional[str] = None
-    supplier_id: Optional[int] = None
-    supplier_name: Optional[str] = None
-    supplier_ruc: Optional[str] = None
+    sku_code: str | None = None
+    sku_description: str | None = None
+    division_code: str | None = None
+    division_name: str | None = None
+    department_code: str | None = None
+    department_name: str | None = None
+    subdepartment_code: str | None = None
+    subdepartment_name: str | None = None
+    class_code: str | None = None
+    class_name: str | None = None
+    subclass_code: str | None = None
+    subclass_name: str | None = None
+    brand_id: str | None = None
+    brand_name: str | None = None
+    supplier_id: int | None = None
+    supplier_name: str | None = None
+    supplier_ruc: str | None = None
     active: bool
-    created_at: Optional[str] = None
+    created_at: IsoDatetime | None = None
     created_by_user_email: str
-    updated_status_by_user_email: Optional[str] = None
-    updated_at: Optional[str] = None
+    updated_status_by_user_email: str | None = None
+    updated_at: IsoDatetime | None = None
+
+    # El mixin nunca se valida por sí mismo
+    model_config = DEFERRED_RESPONSE_CONFIG
+
 
-    model_config = {"from_attributes": True}
+class AgreementProductResponse(_AgreementProductFieldsMixin):
+    """Response schema for agreement products."""
 
 
-class AgreementProductCreateResponse(BaseModel):
+class AgreementProductCreateResponse(_AgreementProductFieldsMixin):
     """Response schema for created agreement products."""
     
+    # Obligatorios tras la creación; al redefinirlos conservan su posición en el mixin
     id: int
-    agreement_id: int
-    sku_code: Optional[str] = None
-    sku_description: Optional[str] = None
-    division_code: Optional[str] = None
-    division_name: Optional[str] = None
-    department_code: Optional[str] = None
-    department_name: Optional[str] = None
-    subdepartment_code: Optional[str] = None
-    subdepartment_name: Optional[str] = None
-    class_code: Optional[str] = None
-    class_name: Optional[str] = None
-    subclass_code: Optional[str] = None
-    subclass_name: Optional[str] = None
-    brand_id: Optional[str] = None
-    brand_name: Optional[str] = None
-    supplier_id: Optional[int] = None
-    supplier_name: Optional[str] = None
-    supplier_ruc: Optional[str] = None
-    active: bool
-    created_at: str
-    created_by_user_email: str
-    updated_status_by_user_email: Optional[str] = None
-    updated_at: Optional[str] = None
-
-    model_config = {"from_attributes": True}
+    created_at: IsoDatetime
 
 #endregion
\ No newline at end of file
@@ -1,21 +1,33 @@
 """Agreement Pydantic schemas for validation and responses."""
 
+import re
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
-
-from app.core.validators import validate_with_timing_protection, validate_secure_string_advanced
+from functools import partial
+from operator import attrgetter
+from typing import Annotated, List, Optional
+
+from app.core.validators import (
+    validate_with_timing_protection,
+    validate_secure_string_advanced,
+    validate_secure_strings_advanced,
+)
 from app.core.agreement_enums import SourceSystemEnum
 from app.core.response import SuccessResponse
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    ConfigDict,
     Field,
-    field_serializer,
+    PlainSerializer,
+    StringConstraints,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
 
 # Import schemas from separated files
+from .common_schema import FROM_ATTRIBUTES_CONFIG
 from .agreement_product_schema import (
     AgreementProductCreateRequest,
     AgreementProductResponse,
@@ -32,693 +44,440 @@ from .agreement_excluded_flag_schema import (
     AgreementExcludedFlagCreateResponse
 )
 
+# Patrones de formato compilados una sola vez (validate_secure_string_advanced acepta Pattern)
+_RE_ALNUM_DASH_UND = re.compile(r'^[a-zA-Z0-9\-_]+$')
+_RE_ALNUM_DASH_UND_DOT_AT = re.compile(r'^[a-zA-Z0-9\-_\.@]+$')
+_RE_SKU = re.compile(r'^[a-zA-Z0-9\-_\.]+$')
+_RE_ALNUM_DASH_UND_WS = re.compile(r'^[a-zA-Z0-9\-_\s]+$')
 
-#region Base Schemas
-
-class AgreementBase(BaseModel):
-    """Base schema for agreement data."""
-    
-    agreement_number: int = Field(
-        ...,
-        ge=1,
-        le=999999999,
-        description="Agreement number (1-999999999)"
-    )
-    description: str = Field(
-        ..., 
-        min_length=1, 
-        max_length=70,
-        description="Agreement description (1-70 characters)"
-    )
-    rebate_type_id: str = Field(
-        ...,
-        max_length=50,
-        description="Rebate type identifier"
-    )
-    source_system: SourceSystemEnum = Field(
-        ...,
-        description="Source system for the agreement"
-    )
-    start_date: date = Field(
-        ...,
-        description="Agreement start date"
-    )
-    end_date: date = Field(
-        ...,
-        description="Agreement end date"
-    )
-    business_unit_id: Optional[int] = Field(
-        ...,
-        gt=0,
-        le=999999999,
-        description="Business unit ID (1-999999999)"
-    )
-    agreement_type_id: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="Agreement type identifier"
-    )
-    activity_name: Optional[str] = Field(
-        None, 
-        max_length=100,
-        description="Activity name"
-    )
-    currency_id: Optional[int] = Field(
-        None, 
-        gt=0,
-        le=999999999,
-        description="Currency ID"
-    )
-    unit_price: Decimal = Field(
-        ...,
-        ge=0,
-        decimal_places=2,
-        description="Unit price (0.00-999999.99)"
-    )
-    billing_type: str = Field(
-        ...,
-        min_length=1,
-        max_length=50,
-        description="Billing type"
-    )
-    pmm_username: Optional[str] = Field(
-        None, 
-        max_length=100,
-        description="PMM username"
-    )
-    store_grouping_id: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="Store grouping identifier"
-    )
-    spf_code: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="SPF code"
-    )
-    spf_description: Optional[str] = Field(
-        None, 
-        max_length=255,
-        description="SPF description"
-    )
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',
-            field_name="Agreement description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('rebate_type_id')
-    @classmethod
-    def validate_rebate_type_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Rebate type ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('agreement_type_id')
-    @classmethod
-    def validate_agreement_type_id(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Agreement type ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('activity_name')
-    @classmethod
-    def validate_activity_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',
-            field_name="Activity name",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('billing_type')
-    @classmethod
-    def validate_billing_type(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
-            field_name="Billing type",
-            normalize_whitespace=True,
-            to_upper=False
-        )
+# source_system ya validado es el miembro del enum: basta comparar identidad
+_PMM = SourceSystemEnum.PMM
 
-    @field_validator('pmm_username')
-    @classmethod
-    def validate_pmm_username(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.@]+$',
-            field_name="PMM username",
-            normalize_whitespace=False,
-            to_upper=False
-        )
 
-    @field_validator('store_grouping_id')
-    @classmethod
-    def validate_store_grouping_id(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Store grouping ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
+def _check_all(values: List[str], field_name: str) -> List[str]:
+    """Security checks for every item of a list filter, with one timing window for the whole list."""
+    return validate_secure_strings_advanced(values, field_name=field_name, normalize_whitespace=False)
 
-    @field_validator('spf_code')
-    @classmethod
-    def validate_spf_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v.strip() == "":
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Allows any character
-            field_name="SPF code",
-            normalize_whitespace=False,
-            to_upper=False
-        )
 
-    @field_validator('spf_description')
-    @classmethod
-    def validate_spf_description(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Allows any character
-            field_name="SPF description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
+# Formato validado por pydantic-core (Rust) tras quitar espacios; los validadores
+# de la mixin solo aplican los chequeos de seguridad
+_Id50Str = Annotated[
+    str, StringConstraints(strip_whitespace=True, max_length=50, pattern=_RE_ALNUM_DASH_UND.pattern)
+]
+_Ruc20Str = Annotated[
+    str, StringConstraints(strip_whitespace=True, max_length=20, pattern=_RE_ALNUM_DASH_UND.pattern)
+]
 
-    @model_validator(mode='after')
-    def validate_dates(self) -> 'AgreementBase':
-        if self.start_date and self.end_date and self.start_date >= self.end_date:
-            raise ValueError("Start date must be before end date")
-        return self
+# Restricciones numéricas compartidas por base, búsqueda, creación y actualización
+_AgreementNumber = Annotated[int, Field(ge=1, le=999999999)]
+_PositiveId = Annotated[int, Field(gt=0, le=999999999)]
+_UnitPrice = Annotated[Decimal, Field(ge=0, decimal_places=2)]
 
-    @model_validator(mode='after')
-    def validate_spf_code_for_pmm(self) -> 'AgreementBase':
-        if self.source_system == SourceSystemEnum.PMM and (self.spf_code is None or self.spf_code.strip() == ""):
-            self.spf_code = None
-        return self
+# Cada elemento se valida en pydantic-core (strip + patrón); el AfterValidator solo
+# corre si la lista no es None y aplica los chequeos de seguridad
+_CodeItem = Annotated[str, StringConstraints(strip_whitespace=True, pattern=_RE_ALNUM_DASH_UND.pattern)]
+_EmailItem = Annotated[str, StringConstraints(strip_whitespace=True, pattern=_RE_ALNUM_DASH_UND_DOT_AT.pattern)]
 
+_DivisionCodeList = Annotated[
+    List[_CodeItem], AfterValidator(partial(_check_all, field_name="Division code"))
+]
+_StatusIdList = Annotated[
+    List[_CodeItem], AfterValidator(partial(_check_all, field_name="Status ID"))
+]
+_CreatorEmailList = Annotated[
+    List[_EmailItem], AfterValidator(partial(_check_all, field_name="Creator email"))
+]
 
-#region Request Schemas
 
-class AgreementSearchRequest(BaseModel):
-    """Schema for searching agreements."""
-    
-    division_codes: Optional[List[str]] = Field(
-        None,
-        description="List of division codes to filter by"
-    )
-    status_ids: Optional[List[str]] = Field(
-        None,
-        description="List of status IDs to filter by"
-    )
-    created_by_emails: Optional[List[str]] = Field(
-        None,
-        description="List of creator emails to filter by"
-    )
-    agreement_number: Optional[int] = Field(
-        None, 
-        ge=1,
-        le=999999999,
-        description="Agreement number to search for"
-    )
-    sku_code: Optional[str] = Field(
-        None,
-        max_length=50,
-        description="SKU code to search for"
-    )
-    description: Optional[str] = Field(
-        None, 
-        max_length=70,
-        description="Agreement description to search for"
-    )
-    rebate_type_id: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="Rebate type ID to filter by"
-    )
-    concept_id: Optional[str] = Field(
-        None,
-        max_length=50,
-        description="Concept ID to filter by"
-    )
-    spf_code: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="SPF code to search for"
-    )
-    spf_description: Optional[str] = Field(
-        None, 
-        max_length=255,
-        description="SPF description to search for"
-    )
-    start_date: Optional[date] = Field(
-        None, 
-        description="Start date to filter by"
-    )
-    end_date: Optional[date] = Field(
-        None,
-        description="End date to filter by"
-    )
-    supplier_ruc: Optional[str] = Field(
-        None,
-        max_length=20,
-        description="Supplier RUC to search for"
-    )
-    supplier_name: Optional[str] = Field(
-        None, 
-        max_length=255,
-        description="Supplier name to search for"
-    )
-    store_grouping_id: Optional[str] = Field(
-        None, 
-        max_length=50,
-        description="Store grouping ID to filter by"
-    )
-    pmm_username: Optional[str] = Field(
-        None,
-        max_length=100,
-        description="PMM username to filter by"
-    )
-    limit: int = Field(
-        10,
-        ge=1,
-        le=100,
-        description="Maximum number of results to return (1-100)"
-    )
-    offset: int = Field(
-        0,
-        ge=0,
-        description="Number of results to skip"
-    )
+# Tipos de salida compartidos por los schemas de respuesta: un solo serializador por tipo,
+# llamado solo para valores no nulos. Decimal se serializa como texto para no perder precisión
+_IsoDate = Annotated[date, PlainSerializer(date.isoformat, return_type=str)]
+_DecimalStr = Annotated[Decimal, PlainSerializer(str, return_type=str)]
 
-    @field_validator('division_codes')
-    @classmethod
-    def validate_division_codes(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
-            return v
-        return [validate_secure_string_advanced(
-            value=code,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Division code",
-            normalize_whitespace=False,
-            to_upper=False
-        ) for code in v]
 
-    @field_validator('status_ids')
-    @classmethod
-    def validate_status_ids(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
-            return v
-        return [validate_secure_string_advanced(
-            value=status_id,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Status ID",
-            normalize_whitespace=False,
-            to_upper=False
-        ) for status_id in v]
+#region Base Schemas
 
-    @field_validator('created_by_emails')
-    @classmethod
-    def validate_created_by_emails(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
-            return v
-        return [validate_secure_string_advanced(
-            value=email,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.@]+$',
-            field_name="Creator email",
-            normalize_whitespace=False,
-            to_upper=False
-        ) for email in v]
+class _AgreementFieldValidatorsMixin(BaseModel):
+    """
+    Field validators shared by the agreement base, search, create and update schemas.
 
-    @field_validator('sku_code')
-    @classmethod
-    def validate_sku_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.]+$',
-            field_name="SKU code",
-            normalize_whitespace=False,
-            to_upper=False
-        )
+    ``check_fields=False`` lets each schema inherit only the validators of the
+    fields it declares; required fields never reach the ``None`` guard.
+    """
 
-    @field_validator('description')
+    @field_validator('description', check_fields=False)
     @classmethod
     def validate_description(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',
             field_name="Agreement description",
             normalize_whitespace=True,
             to_upper=False
         )
 
-    @field_validator('rebate_type_id')
+    @field_validator('rebate_type_id', check_fields=False)
     @classmethod
     def validate_rebate_type_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
             field_name="Rebate type ID",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('concept_id')
+    @field_validator('concept_id', check_fields=False)
     @classmethod
     def validate_concept_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
             field_name="Concept ID",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('spf_code')
+    @field_validator('status_id', check_fields=False)
     @classmethod
-    def validate_spf_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v.strip() == "":
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',
-            field_name="SPF code",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('spf_description')
-    @classmethod
-    def validate_spf_description(cls, v: Optional[str]) -> Optional[str]:
+    def validate_status_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',
-            field_name="SPF description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('supplier_ruc')
-    @classmethod
-    def validate_supplier_ruc(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Supplier RUC",
+            field_name="Status ID",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('supplier_name')
+    @field_validator('activity_name', check_fields=False)
     @classmethod
-    def validate_supplier_name(cls, v: Optional[str]) -> Optional[str]:
+    def validate_activity_name(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',
-            field_name="Supplier name",
+            field_name="Activity name",
             normalize_whitespace=True,
             to_upper=False
         )
 
-    @field_validator('store_grouping_id')
+    @field_validator('billing_type', check_fields=False)
     @classmethod
-    def validate_store_grouping_id(cls, v: Optional[str]) -> Optional[str]:
+    def validate_billing_type(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Store grouping ID",
-            normalize_whitespace=False,
+            allowed_pattern=_RE_ALNUM_DASH_UND_WS,
+            field_name="Billing type",
+            normalize_whitespace=True,
             to_upper=False
         )
 
-    @field_validator('pmm_username')
+    @field_validator('pmm_username', check_fields=False)
     @classmethod
     def validate_pmm_username(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.@]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND_DOT_AT,
             field_name="PMM username",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @model_validator(mode='after')
-    def validate_dates(self) -> 'AgreementSearchRequest':
-        if self.start_date and self.end_date and self.start_date >= self.end_date:
-            raise ValueError("Start date must be before end date")
-        return self
-
-
-class AgreementCreateRequest(BaseModel):
-    """Schema for creating agreements."""
-    
-    start_date: Optional[date] = Field(None, description="Agreement start date")
-    end_date: Optional[date] = Field(None, description="Agreement end date")
-    rebate_type_id: str = Field(..., max_length=50, description="Rebate type identifier")
-    concept_id: str = Field(..., max_length=50, description="Concept identifier")
-    activity_name: Optional[str] = Field(None, max_length=100, description="Activity name")
-    source_system: SourceSystemEnum = Field(..., description="Source system for the agreement")
-    spf_code: Optional[str] = Field(None, max_length=50, description="SPF code")
-    spf_description: Optional[str] = Field(None, max_length=255, description="SPF description")
-    store_grouping_id: Optional[str] = Field(None, max_length=50, description="Store grouping identifier")
-    excluded_flags: List[AgreementExcludedFlagCreateRequest] = Field(
-        default_factory=list,
-        description="List of excluded flags"
-    )
-    unit_price: Decimal = Field(..., ge=0, decimal_places=2, description="Unit price")
-    billing_type: str = Field(..., min_length=1, max_length=50, description="Billing type")
-    pmm_username: Optional[str] = Field(None, max_length=100, description="PMM username")
-    description: str = Field(..., min_length=1, max_length=70, description="Agreement description")
-    products: List[AgreementProductCreateRequest] = Field(
-        ...,
-            min_length=1,
-        description="List of products (minimum 1 required)"
-    )
-    currency_id: Optional[int] = Field(None, gt=0, le=999999999, description="Currency ID")
-    status_id: str = Field(..., max_length=50, description="Status identifier")
-    store_rules: List[AgreementStoreRuleCreateRequest] = Field(
-        default_factory=list,
-        description="List of store rules"
-    )
-    business_unit_id: Optional[int] = Field(..., gt=0, le=999999999, description="Business unit ID")
-    agreement_number: Optional[int] = Field(None, ge=1, le=999999999, description="Agreement number")
-    agreement_type_id: Optional[str] = Field(None, max_length=50, description="Agreement type identifier")
-
-    @field_validator('rebate_type_id')
-    @classmethod
-    def validate_rebate_type_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Rebate type ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('concept_id')
-    @classmethod
-    def validate_concept_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Concept ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('activity_name')
+    @field_validator('store_grouping_id', check_fields=False)
     @classmethod
-    def validate_activity_name(cls, v: Optional[str]) -> Optional[str]:
+    def validate_store_grouping_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',  # Allows any character
-            field_name="Activity name",
-            normalize_whitespace=True,
+            field_name="Store grouping ID",
+            normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('spf_code')
+    @field_validator('spf_code', check_fields=False)
     @classmethod
-    def validate_spf_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v.strip() == "":
-            return v
+    def validate_spf_code(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        # isspace() evita crear la copia que hace strip() solo para compararla con ""
+        if not v or v.isspace():
+            # PMM no usa SPF: un código vacío se guarda como None
+            # (source_system se declara antes que spf_code, así que ya está en info.data)
+            return None if info.data.get('source_system') is _PMM else v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',  # Allows any character
             field_name="SPF code",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('spf_description')
+    @field_validator('spf_description', check_fields=False)
     @classmethod
     def validate_spf_description(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'.*',  # Allows any character
             field_name="SPF description",
             normalize_whitespace=True,
             to_upper=False
         )
 
-    @field_validator('store_grouping_id')
+
+class AgreementBase(_AgreementFieldValidatorsMixin):
+    """Base schema for agreement data."""
+    
+    # Ningún endpoint lo usa hoy: su validador se construye recién si alguien lo usa
+    model_config = ConfigDict(defer_build=True)
+
+    agreement_number: _AgreementNumber = Field(
+        ...,
+        description="Agreement number (1-999999999)"
+    )
+    description: str = Field(
+        ..., 
+        min_length=1, 
+        max_length=70,
+        description="Agreement description (1-70 characters)"
+    )
+    rebate_type_id: _Id50Str = Field(
+        ...,
+        description="Rebate type identifier"
+    )
+    source_system: SourceSystemEnum = Field(
+        ...,
+        description="Source system for the agreement"
+    )
+    start_date: date = Field(
+        ...,
+        description="Agreement start date"
+    )
+    end_date: date = Field(
+        ...,
+        description="Agreement end date"
+    )
+    business_unit_id: Optional[_PositiveId] = Field(
+        ...,
+        description="Business unit ID (1-999999999)"
+    )
+    agreement_type_id: Optional[_Id50Str] = Field(
+        None, 
+        description="Agreement type identifier"
+    )
+    activity_name: Optional[str] = Field(
+        None, 
+        max_length=100,
+        description="Activity name"
+    )
+    currency_id: Optional[_PositiveId] = Field(
+        None, 
+        description="Currency ID"
+    )
+    unit_price: _UnitPrice = Field(
+        ...,
+        description="Unit price (0.00-999999.99)"
+    )
+    billing_type: str = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Billing type"
+    )
+    pmm_username: Optional[str] = Field(
+        None, 
+        max_length=100,
+        description="PMM username"
+    )
+    store_grouping_id: Optional[_Id50Str] = Field(
+        None, 
+        description="Store grouping identifier"
+    )
+    spf_code: Optional[str] = Field(
+        None, 
+        max_length=50,
+        description="SPF code"
+    )
+    spf_description: Optional[str] = Field(
+        None, 
+        max_length=255,
+        description="SPF description"
+    )
+
+    @field_validator('agreement_type_id')
     @classmethod
-    def validate_store_grouping_id(cls, v: Optional[str]) -> Optional[str]:
+    def validate_agreement_type_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Store grouping ID",
+            field_name="Agreement type ID",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('billing_type')
-    @classmethod
-    def validate_billing_type(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
-            field_name="Billing type",
-            normalize_whitespace=True,
-            to_upper=False
-        )
+    @model_validator(mode='after')
+    def validate_model(self) -> 'AgreementBase':
+        # Un solo validador 'after' para las reglas entre campos
+        if self.start_date and self.end_date and self.start_date >= self.end_date:
+            raise ValueError("Start date must be before end date")
+        return self
+
+
+#region Request Schemas
+
+class AgreementSearchRequest(_AgreementFieldValidatorsMixin):
+    """Schema for searching agreements."""
+    
+    division_codes: Optional[_DivisionCodeList] = Field(
+        None,
+        description="List of division codes to filter by"
+    )
+    status_ids: Optional[_StatusIdList] = Field(
+        None,
+        description="List of status IDs to filter by"
+    )
+    created_by_emails: Optional[_CreatorEmailList] = Field(
+        None,
+        description="List of creator emails to filter by"
+    )
+    agreement_number: Optional[_AgreementNumber] = Field(
+        None, 
+        description="Agreement number to search for"
+    )
+    sku_code: Optional[str] = Field(
+        None,
+        max_length=50,
+        description="SKU code to search for"
+    )
+    description: Optional[str] = Field(
+        None, 
+        max_length=70,
+        description="Agreement description to search for"
+    )
+    rebate_type_id: Optional[_Id50Str] = Field(
+        None, 
+        description="Rebate type ID to filter by"
+    )
+    concept_id: Optional[_Id50Str] = Field(
+        None,
+        description="Concept ID to filter by"
+    )
+    spf_code: Optional[str] = Field(
+        None, 
+        max_length=50,
+        description="SPF code to search for"
+    )
+    spf_description: Optional[str] = Field(
+        None, 
+        max_length=255,
+        description="SPF description to search for"
+    )
+    start_date: Optional[date] = Field(
+        None, 
+        description="Start date to filter by"
+    )
+    end_date: Optional[date] = Field(
+        None,
+        description="End date to filter by"
+    )
+    supplier_ruc: Optional[_Ruc20Str] = Field(
+        None,
+        description="Supplier RUC to search for"
+    )
+    supplier_name: Optional[str] = Field(
+        None, 
+        max_length=255,
+        description="Supplier name to search for"
+    )
+    store_grouping_id: Optional[_Id50Str] = Field(
+        None, 
+        description="Store grouping ID to filter by"
+    )
+    pmm_username: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="PMM username to filter by"
+    )
+    limit: int = Field(
+        10,
+        ge=1,
+        le=100,
+        description="Maximum number of results to return (1-100)"
+    )
+    offset: int = Field(
+        0,
+        ge=0,
+        description="Number of results to skip"
+    )
 
-    @field_validator('pmm_username')
+    @field_validator('sku_code')
     @classmethod
-    def validate_pmm_username(cls, v: Optional[str]) -> Optional[str]:
+    def validate_sku_code(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.@]+$',
-            field_name="PMM username",
+            allowed_pattern=_RE_SKU,
+            field_name="SKU code",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',
-            field_name="Agreement description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('status_id')
+    @field_validator('supplier_ruc')
     @classmethod
-    def validate_status_id(cls, v: str) -> str:
+    def validate_supplier_ruc(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Status ID",
+            field_name="Supplier RUC",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    @field_validator('agreement_type_id')
+    @field_validator('supplier_name')
     @classmethod
-    def validate_agreement_type_id(cls, v: Optional[str]) -> Optional[str]:
+    def validate_supplier_name(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Agreement type ID",
-            normalize_whitespace=False,
+            field_name="Supplier name",
+            normalize_whitespace=True,
             to_upper=False
         )
 
     @model_validator(mode='after')
-    def validate_dates(self) -> 'AgreementCreateRequest':
+    def validate_dates(self) -> 'AgreementSearchRequest':
         if self.start_date and self.end_date and self.start_date >= self.end_date:
             raise ValueError("Start date must be before end date")
         return self
 
-    @model_validator(mode='after')
-    def validate_products(self) -> 'AgreementCreateRequest':
-        if not self.products:
-            raise ValueError("At least one product is required")
-        return self
-
-    @model_validator(mode='after')
-    def validate_spf_code_for_pmm(self) -> 'AgreementCreateRequest':
-        if self.source_system == SourceSystemEnum.PMM and (self.spf_code is None or self.spf_code.strip() == ""):
-            self.spf_code = None
-        return self
-
 
-class AgreementUpdateRequest(BaseModel):
-    """Schema for updating agreements."""
+class _AgreementWriteRequestBase(_AgreementFieldValidatorsMixin):
+    """Fields and cross-field rules shared by the create and update requests."""
     
     start_date: Optional[date] = Field(None, description="Agreement start date")
     end_date: Optional[date] = Field(None, description="Agreement end date")
-    rebate_type_id: str = Field(..., max_length=50, description="Rebate type identifier")
-    concept_id: str = Field(..., max_length=50, description="Concept identifier")
+    rebate_type_id: _Id50Str = Field(..., description="Rebate type identifier")
+    concept_id: _Id50Str = Field(..., description="Concept identifier")
     activity_name: Optional[str] = Field(None, max_length=100, description="Activity name")
     source_system: SourceSystemEnum = Field(..., description="Source system for the agreement")
     spf_code: Optional[str] = Field(None, max_length=50, description="SPF code")
     spf_description: Optional[str] = Field(None, max_length=255, description="SPF description")
-    store_grouping_id: Optional[str] = Field(None, max_length=50, description="Store grouping identifier")
+    store_grouping_id: Optional[_Id50Str] = Field(None, description="Store grouping identifier")
     excluded_flags: List[AgreementExcludedFlagCreateRequest] = Field(
         default_factory=list,
         description="List of excluded flags"
     )
-    unit_price: Decimal = Field(..., ge=0, decimal_places=2, description="Unit price")
+    unit_price: _UnitPrice = Field(..., description="Unit price")
     billing_type: str = Field(..., min_length=1, max_length=50, description="Billing type")
     pmm_username: Optional[str] = Field(None, max_length=100, description="PMM username")
     description: str = Field(..., min_length=1, max_length=70, description="Agreement description")
@@ -727,165 +486,47 @@ class AgreementUpdateRequest(BaseModel):
         min_length=1,
         description="List of products (minimum 1 required)"
     )
-    currency_id: Optional[int] = Field(None, gt=0, le=999999999, description="Currency ID")
-    status_id: str = Field(..., max_length=50, description="Status identifier")
+    currency_id: Optional[_PositiveId] = Field(None, description="Currency ID")
+    status_id: _Id50Str = Field(..., description="Status identifier")
     store_rules: List[AgreementStoreRuleCreateRequest] = Field(
         default_factory=list,
         description="List of store rules"
     )
-    business_unit_id: Optional[int] = Field(None, gt=0, le=999999999, description="Business unit ID")
-    agreement_type_id: Optional[str] = Field(None, max_length=50, description="Agreement type identifier")
-
-    @field_validator('rebate_type_id')
-    @classmethod
-    def validate_rebate_type_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Rebate type ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('concept_id')
-    @classmethod
-    def validate_concept_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Concept ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('activity_name')
-    @classmethod
-    def validate_activity_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Permite cualquier carácter
-            field_name="Activity name",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('spf_code')
-    @classmethod
-    def validate_spf_code(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v.strip() == "":
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Permite cualquier carácter
-            field_name="SPF code",
-            normalize_whitespace=False,
-            to_upper=False
-        )
+    business_unit_id: Optional[_PositiveId] = Field(None, description="Business unit ID")
 
-    @field_validator('spf_description')
-    @classmethod
-    def validate_spf_description(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Permite cualquier carácter
-            field_name="SPF description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
+    @model_validator(mode='after')
+    def validate_model(self) -> '_AgreementWriteRequestBase':
+        if self.start_date and self.end_date and self.start_date >= self.end_date:
+            raise ValueError("Start date must be before end date")
+        if not self.products:
+            raise ValueError("At least one product is required")
+        return self
 
-    @field_validator('store_grouping_id')
-    @classmethod
-    def validate_store_grouping_id(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Store grouping ID",
-            normalize_whitespace=False,
-            to_upper=False
-        )
 
-    @field_validator('billing_type')
-    @classmethod
-    def validate_billing_type(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
-            field_name="Billing type",
-            normalize_whitespace=True,
-            to_upper=False
-        )
+class AgreementCreateRequest(_AgreementWriteRequestBase):
+    """Schema for creating agreements."""
+    
+    business_unit_id: Optional[_PositiveId] = Field(..., description="Business unit ID")
+    agreement_number: Optional[_AgreementNumber] = Field(None, description="Agreement number")
+    agreement_type_id: Optional[_Id50Str] = Field(None, description="Agreement type identifier")
 
-    @field_validator('pmm_username')
+    @field_validator('agreement_type_id')
     @classmethod
-    def validate_pmm_username(cls, v: Optional[str]) -> Optional[str]:
+    def validate_agreement_type_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.@]+$',
-            field_name="PMM username",
-            normalize_whitespace=False,
-            to_upper=False
-        )
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'.*',  # Permite cualquier carácter
-            field_name="Agreement description",
-            normalize_whitespace=True,
-            to_upper=False
-        )
-
-    @field_validator('status_id')
-    @classmethod
-    def validate_status_id(cls, v: str) -> str:
-        return validate_secure_string_advanced(
-            value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-            field_name="Status ID",
+            field_name="Agreement type ID",
             normalize_whitespace=False,
             to_upper=False
         )
 
-    # @field_validator('agreement_type_id')
-    # @classmethod
-    # def validate_agreement_type_id(cls, v: Optional[str]) -> Optional[str]:
-    #     if v is None:
-    #         return v
-    #     return validate_secure_string_advanced(
-    #         value=v,
-    #         allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
-    #         field_name="Agreement type ID",
-    #         normalize_whitespace=False,
-    #         to_upper=False
-    #     )
-
-    @model_validator(mode='after')
-    def validate_dates(self) -> 'AgreementUpdateRequest':
-        if self.start_date and self.end_date and self.start_date >= self.end_date:
-            raise ValueError("Start date must be before end date")
-        return self
-
-    @model_validator(mode='after')
-    def validate_products(self) -> 'AgreementUpdateRequest':
-        if not self.products:
-            raise ValueError("At least one product is required")
-        return self
 
-    @model_validator(mode='after')
-    def validate_spf_code_for_pmm(self) -> 'AgreementUpdateRequest':
-        if self.source_system == SourceSystemEnum.PMM and (self.spf_code is None or self.spf_code.strip() == ""):
-            self.spf_code = None
-        return self
+class AgreementUpdateRequest(_AgreementWriteRequestBase):
+    """Schema for updating agreements."""
+    
+    agreement_type_id: Optional[str] = Field(None, max_length=50, description="Agreement type identifier")
 
 
 #endregion
@@ -899,8 +540,8 @@ class AgreementResponse(BaseModel):
     id: int
     business_unit_id: int
     agreement_number: Optional[int] = None
-    start_date: Optional[date] = None
-    end_date: Optional[date] = None
+    start_date: Optional[_IsoDate] = None
+    end_date: Optional[_IsoDate] = None
     agreement_type_id: Optional[str] = None
     status_id: str
     status_name: Optional[str] = None
@@ -932,16 +573,22 @@ class AgreementResponse(BaseModel):
     store_grouping_description: Optional[str] = None
     
     # Nested objects
-    products: List[AgreementProductResponse] = []
-    store_rules: List[AgreementStoreRuleResponse] = []
-    excluded_flags: List[AgreementExcludedFlagResponse] = []
+    products: List[AgreementProductResponse] = Field(default_factory=list)
+    store_rules: List[AgreementStoreRuleResponse] = Field(default_factory=list)
+    excluded_flags: List[AgreementExcludedFlagResponse] = Field(default_factory=list)
+
+    @classmethod
+    def build_trusted(cls, **data) -> 'AgreementResponse':
+        """Build the response from trusted domain data without validation.
 
-    @field_serializer('start_date', 'end_date')
-    def serialize_date(self, value: Optional[date]) -> Optional[str]:
-        """Serialize date to ISO format."""
-        return value.isoformat() if value else None
+        Uses ``model_construct``: only for values coming from domain entities
+        already validated on the way in, with the declared field types. The
+        schema has no field validators, so nothing is bypassed.
+        """
+        return cls.model_construct(**data)
 
-    model_config = {"from_attributes": True}
+    # Respuesta inmutable y sin campos extra una vez construida
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
 
 
 class AgreementCreateResponse(BaseModel):
@@ -950,8 +597,8 @@ class AgreementCreateResponse(BaseModel):
     id: int
     business_unit_id: Optional[int]
     agreement_number: Optional[int] = None
-    start_date: Optional[date] = None
-    end_date: Optional[date] = None
+    start_date: Optional[_IsoDate] = None
+    end_date: Optional[_IsoDate] = None
     agreement_type_id: Optional[str] = None
     status_id: str
     rebate_type_id: str
@@ -973,96 +620,45 @@ class AgreementCreateResponse(BaseModel):
     updated_status_by_user_email: Optional[str] = None
     
     # Nested objects
-    products: List[AgreementProductCreateResponse] = []
-    store_rules: List[AgreementStoreRuleCreateResponse] = []
-    excluded_flags: List[AgreementExcludedFlagCreateResponse] = []
+    products: List[AgreementProductCreateResponse] = Field(default_factory=list)
+    store_rules: List[AgreementStoreRuleCreateResponse] = Field(default_factory=list)
+    excluded_flags: List[AgreementExcludedFlagCreateResponse] = Field(default_factory=list)
 
     @classmethod
     def from_domain_model(cls, agreement_domain_model) -> 'AgreementCreateResponse':
-        return cls(
-            id=agreement_domain_model.id,
-            business_unit_id=agreement_domain_model.business_unit_id,
-            agreement_number=agreement_domain_model.agreement_number,
-            start_date=agreement_domain_model.start_date,
-            end_date=agreement_domain_model.end_date,
-            agreement_type_id=agreement_domain_model.agreement_type_id,
-            status_id=agreement_domain_model.status_id,
-            rebate_type_id=agreement_domain_model.rebate_type_id,
-            concept_id=agreement_domain_model.concept_id,
-            description=agreement_domain_model.description,
-            activity_name=agreement_domain_model.activity_name,
-            source_system=agreement_domain_model.source_system,
-            spf_code=agreement_domain_model.spf_code,
-            spf_description=agreement_domain_model.spf_description,
-            currency_id=agreement_domain_model.currency_id,
-            unit_price=agreement_domain_model.unit_price,
-            billing_type=agreement_domain_model.billing_type,
-            pmm_username=agreement_domain_model.pmm_username,
-            store_grouping_id=agreement_domain_model.store_grouping_id,
-            active=agreement_domain_model.active,
-            created_at=agreement_domain_model.created_at,
-            created_by_user_email=agreement_domain_model.created_by_user_email,
-            updated_at=agreement_domain_model.updated_at,
-            updated_status_by_user_email=agreement_domain_model.updated_status_by_user_email,
-            products=[
-                AgreementProductCreateResponse(
-                    id=product.id,
-                    agreement_id=product.agreement_id,
-                    sku_code=product.sku_code,
-                    sku_description=product.sku_description,
-                    division_code=product.division_code,
-                    division_name=product.division_name,
-                    department_code=product.department_code,
-                    department_name=product.department_name,
-                    subdepartment_code=product.subdepartment_code,
-                    subdepartment_name=product.subdepartment_name,
-                    class_code=product.class_code,
-                    class_name=product.class_name,
-                    subclass_code=product.subclass_code,
-                    subclass_name=product.subclass_name,
-                    brand_id=product.brand_id,
-                    brand_name=product.brand_name,
-                    supplier_id=product.supplier_id,
-                    supplier_name=product.supplier_name,
-                    supplier_ruc=product.supplier_ruc,
-                    active=product.active,
-                    created_at=product.created_at,
-                    created_by_user_email=product.created_by_user_email,
-                    updated_status_by_user_email=product.updated_status_by_user_email,
-                    updated_at=product.updated_at
-                ) for product in agreement_domain_model.products
-            ],
-            store_rules=[
-                AgreementStoreRuleCreateResponse(
-                    id=rule.id,
-                    agreement_id=rule.agreement_id,
-                    store_id=rule.store_id,
-                    status=rule.status,
-                    active=rule.active,
-                    created_at=rule.created_at,
-                    created_by_user_email=rule.created_by_user_email,
-                    updated_status_by_user_email=rule.updated_status_by_user_email,
-                    updated_at=rule.updated_at
-                ) for rule in agreement_domain_model.store_rules
-            ],
-            excluded_flags=[
-                AgreementExcludedFlagCreateResponse(
-                    id=flag.id,
-                    agreement_id=flag.agreement_id,
-                    excluded_flag_id=flag.excluded_flag_id,
-                    active=flag.active,
-                    created_at=flag.created_at,
-                    created_by_user_email=flag.created_by_user_email,
-                    updated_at=flag.updated_at,
-                    updated_status_by_user_email=flag.updated_status_by_user_email
-                ) for flag in agreement_domain_model.excluded_flags
-            ]
-        )
-
-    @field_serializer('start_date', 'end_date')
-    def serialize_date(self, value: Optional[date]) -> Optional[str]:
-        """Serialize date to ISO format."""
-        return value.isoformat() if value else None
+        # Los campos se leen con attrgetter (en C) y se validan en pydantic-core:
+        # con pydantic 2.9 es más rápido que model_construct, que recorre los campos en Python
+        data = dict(zip(_AGREEMENT_FIELDS, _get_agreement_fields(agreement_domain_model)))
+        # Referencias locales: evitan la búsqueda global + atributo en cada elemento
+        validate_product = AgreementProductCreateResponse.model_validate
+        validate_store_rule = AgreementStoreRuleCreateResponse.model_validate
+        validate_flag = AgreementExcludedFlagCreateResponse.model_validate
+        data['products'] = [
+            validate_product(dict(zip(_PRODUCT_FIELDS, _get_product_fields(product))))
+            for product in agreement_domain_model.products
+        ]
+        data['store_rules'] = [
+            validate_store_rule(dict(zip(_STORE_RULE_FIELDS, _get_store_rule_fields(rule))))
+            for rule in agreement_domain_model.store_rules
+        ]
+        data['excluded_flags'] = [
+            validate_flag(dict(zip(_EXCLUDED_FLAG_FIELDS, _get_excluded_flag_fields(flag))))
+            for flag in agreement_domain_model.excluded_flags
+        ]
+        return cls.model_validate(data)
+
+
+# Plan de copia de from_domain_model: un attrgetter (en C) lee todos los campos de cada
+# objeto de una vez; los nombres salen de los propios schemas para no desincronizarse
+_NESTED_FIELDS = ('products', 'store_rules', 'excluded_flags')
+_AGREEMENT_FIELDS = tuple(name for name in AgreementCreateResponse.model_fields if name not in _NESTED_FIELDS)
+_PRODUCT_FIELDS = tuple(AgreementProductCreateResponse.model_fields)
+_STORE_RULE_FIELDS = tuple(AgreementStoreRuleCreateResponse.model_fields)
+_EXCLUDED_FLAG_FIELDS = tuple(AgreementExcludedFlagCreateResponse.model_fields)
+_get_agreement_fields = attrgetter(*_AGREEMENT_FIELDS)
+_get_product_fields = attrgetter(*_PRODUCT_FIELDS)
+_get_store_rule_fields = attrgetter(*_STORE_RULE_FIELDS)
+_get_excluded_flag_fields = attrgetter(*_EXCLUDED_FLAG_FIELDS)
 
 
 class AgreementCreateSuccessResponse(SuccessResponse[AgreementCreateResponse]):
@@ -1085,8 +681,8 @@ class AgreementSearchResultItem(BaseModel):
     agreement_number: Optional[int] = None
     description: Optional[str] = None
     source_system: SourceSystemEnum
-    start_date: Optional[date] = None
-    end_date: Optional[date] = None
+    start_date: Optional[_IsoDate] = None
+    end_date: Optional[_IsoDate] = None
     created_at: str
     created_by_user_email: str
     updated_at: str
@@ -1111,7 +707,7 @@ class AgreementSearchResultItem(BaseModel):
     # Financial information
     currency_id: Optional[int] = None
     currency_code: Optional[str] = None
-    unit_price: Optional[Decimal] = None
+    unit_price: Optional[_DecimalStr] = None
     billing_type: Optional[str] = None
     billing_type_description: Optional[str] = None
     
@@ -1142,17 +738,8 @@ class AgreementSearchResultItem(BaseModel):
     supplier_name: Optional[str] = None
     supplier_ruc: Optional[str] = None
 
-    @field_serializer('start_date', 'end_date')
-    def serialize_date(self, value: Optional[date]) -> Optional[str]:
-        """Serialize date to ISO format."""
-        return value.isoformat() if value else None
-
-    @field_serializer('unit_price')
-    def serialize_decimal(self, value: Optional[Decimal]) -> Optional[str]:
-        """Serialize decimal to string to avoid precision issues."""
-        return str(value) if value is not None else None
-
-    model_config = {"from_attributes": True}
+    # Se construye una vez por fila y solo se lee hasta serializarse
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AgreementSearchResponse(BaseModel):
@@ -1161,7 +748,7 @@ class AgreementSearchResponse(BaseModel):
     agreements: List[AgreementSearchResultItem]
     total_count: int
 
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class AgreementDetailResponse(BaseModel):
@@ -1171,8 +758,8 @@ class AgreementDetailResponse(BaseModel):
     id: int = Field(..., description="Agreement ID")
     business_unit_id: int = Field(..., description="Business unit ID")
     agreement_number: Optional[int] = Field(None, description="Agreement number")
-    start_date: Optional[date] = Field(None, description="Start date")
-    end_date: Optional[date] = Field(None, description="End date")
+    start_date: Optional[_IsoDate] = Field(None, description="Start date")
+    end_date: Optional[_IsoDate] = Field(None, description="End date")
     agreement_type_id: Optional[str] = Field(None, description="Agreement type ID")
     status_id: str = Field(..., description="Agreement status ID")
     rebate_type_id: str = Field(..., description="Rebate type ID")
@@ -1183,7 +770,7 @@ class AgreementDetailResponse(BaseModel):
     spf_code: Optional[str] = Field(None, description="SPF code")
     spf_description: Optional[str] = Field(None, description="SPF description")
     currency_id: Optional[int] = Field(None, description="Currency ID")
-    unit_price: Decimal = Field(..., description="Unit price")
+    unit_price: _DecimalStr = Field(..., description="Unit price")
     billing_type: str = Field(..., description="Billing type")
     pmm_username: Optional[str] = Field(None, description="PMM username")
     store_grouping_id: Optional[str] = Field(None, description="Store grouping ID")
@@ -1216,23 +803,13 @@ class AgreementDetailResponse(BaseModel):
         description="List of agreement excluded flags"
     )
 
-    @field_serializer('start_date', 'end_date')
-    def serialize_date(self, value: Optional[date]) -> Optional[str]:
-        """Serialize date to ISO format."""
-        return value.isoformat() if value else None
-
-    @field_serializer('unit_price')
-    def serialize_decimal(self, value: Decimal) -> str:
-        """Serialize decimal to string to avoid precision issues."""
-        return str(value)
-
-    model_config = {
-        "from_attributes": True
-    }
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class AgreementDetailSuccessResponse(SuccessResponse[AgreementDetailResponse]):
     """Success response wrapper for agreement detail."""
-    pass
+
+    # El endpoint de detalle declara SuccessResponse[AgreementDetailResponse]
+    model_config = ConfigDict(defer_build=True)
 
 #endregion
\ No newline at end of file
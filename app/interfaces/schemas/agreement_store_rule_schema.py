@@ -1,5 +1,6 @@
 """Agreement Store Rule Pydantic schemas for validation and responses."""
 
+import re
 from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
@@ -12,6 +13,11 @@ from pydantic import (
     field_validator,
 )
 
+from .common_schema import FROM_ATTRIBUTES_CONFIG
+
+# Formato del status, compilado al importar
+_RE_ALNUM_DASH_UND_WS = re.compile(r'^[a-zA-Z0-9\-_\s]+$')
+
 
 #region Base Schemas
 
@@ -36,7 +42,7 @@ class AgreementStoreRuleBase(BaseModel):
     def validate_status(cls, v: str) -> str:
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\s]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND_WS,
             field_name="Store rule status",
             max_repeated_chars=3,
             normalize_whitespace=True,
@@ -71,7 +77,7 @@ class AgreementStoreRuleResponse(BaseModel):
     updated_at: Optional[str] = None
     store_name: Optional[str] = None  # Store name from store catalog
 
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class AgreementStoreRuleCreateResponse(BaseModel):
@@ -87,15 +93,13 @@ class AgreementStoreRuleCreateResponse(BaseModel):
     updated_status_by_user_email: Optional[str] = None
     updated_at: str
 
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
     active: bool = Field(..., description="Active status")
     created_at: str = Field(..., description="Creation timestamp")
     created_by_user_email: str = Field(..., description="Creator email")
     updated_status_by_user_email: Optional[str] = Field(None, description="Last updater email")
     updated_at: str = Field(..., description="Last update timestamp")
 
-    model_config = {
-        "from_attributes": True
-    }
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 #endregion
@@ -36,7 +36,8 @@ class AgreementsBulkUploadDocumentSchema(AgreementsBulkUploadDocumentBase):
 class BulkUploadRowSchema(BaseModel):
     """Schema for individual bulk upload row data."""
     
-    model_config = ConfigDict(from_attributes=True)
+    # La carga masiva no valida filas con este schema: se construye solo si se usa
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     pmm_user: Optional[str] = Field(None, max_length=150, description="PMM User")
     group_name: Optional[str] = Field(None, max_length=150, description="Grouping")
@@ -81,7 +82,7 @@ class BulkUploadProcessResponse(BaseModel):
     processing_status: str
     file_name: str
     processing_time_seconds: float
-    validation_errors: List[str] = []
+    validation_errors: List[str] = Field(default_factory=list)
     final_status: str
 
 
@@ -0,0 +1,28 @@
+"""Configs and field types shared by the agreement schema modules."""
+
+from datetime import datetime
+from typing import Annotated, List, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, PlainSerializer, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Schemas de respuesta construidos desde entidades de dominio (una sola instancia)
+FROM_ATTRIBUTES_CONFIG = ConfigDict(from_attributes=True)
+
+# Requests anidados del acuerdo: ignoran campos extra y se construyen al arrancar (app_lifespan)
+REQUEST_CONFIG = ConfigDict(extra='ignore', defer_build=True)
+
+# Respuestas de productos y flags: se leen desde entidades y se construyen al arrancar
+DEFERRED_RESPONSE_CONFIG = ConfigDict(from_attributes=True, defer_build=True)
+
+# Timestamp en ISO 8601 solo en JSON; el OpenAPI de las respuestas lo expone como string
+IsoDatetime = Annotated[datetime, PlainSerializer(datetime.isoformat, return_type=str, when_used='json')]
+
+
+def list_adapter(model: Type[ModelT]) -> TypeAdapter[List[ModelT]]:
+    """Adapter that validates a whole batch of ``model`` items in a single call.
+
+    Meant to be built once at import, next to the model it wraps.
+    """
+    return TypeAdapter(List[model])
@@ -1,6 +1,6 @@
 """Division application schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 #region Response Schemas
@@ -12,14 +12,15 @@ class DivisionResponse(BaseModel):
     division_code: str
     division_name: str
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "division_id": 1,
                 "division_code": "J01",
                 "division_name": "PGC COMESTIBLE"
             }
-        }
+        },
+    )
 
 #endregion
@@ -1,12 +1,17 @@
 """Lookup Pydantic schemas for validation."""
 
+import re
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
-from app.core.validators import validate_with_timing_protection
+from app.core.validators import GENERIC_NAMES, validate_with_timing_protection
 from app.core.response import BaseResponse, SuccessResponse
 from app.domain.entities.lookup import LookupValueResult
 
+# Patrones compilados una sola vez (validate_with_timing_protection acepta Pattern)
+_RE_CATEGORY_CODE = re.compile(r'^[A-Z0-9_]+$')
+_RE_OPTION_VALUE = re.compile(r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$')
+
 
 #region Request Schemas
 
@@ -29,8 +34,8 @@ class LookupCategoryCodeRequest(BaseModel):
             field_name="Category code",
             min_length=2,
             max_length=50,
-            allowed_chars=r'^[A-Z0-9_]+$',
-            generic_names=['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
+            allowed_chars=_RE_CATEGORY_CODE,
+            generic_names=GENERIC_NAMES
         )
 
 
@@ -59,8 +64,8 @@ class LookupOptionValueRequest(BaseModel):
             field_name="Category code",
             min_length=2,
             max_length=50,
-            allowed_chars=r'^[A-Z0-9_]+$',
-            generic_names=['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
+            allowed_chars=_RE_CATEGORY_CODE,
+            generic_names=GENERIC_NAMES
         )
     
     @field_validator('option_value')
@@ -72,8 +77,8 @@ class LookupOptionValueRequest(BaseModel):
             field_name="Option value",
             min_length=1,
             max_length=100,
-            allowed_chars=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$',
-            generic_names=['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
+            allowed_chars=_RE_OPTION_VALUE,
+            generic_names=GENERIC_NAMES
         )
 
 #endregion
@@ -88,22 +93,15 @@ class LookupValueResponse(BaseModel):
     option_key: str
     display_value: str
     option_value: str
-    metadata: dict = {}
+    metadata: dict = Field(default_factory=dict)
     sort_order: Optional[int] = None
     parent_id: Optional[int] = None
     
     @classmethod
     def from_domain_model(cls, domain_model: LookupValueResult) -> 'LookupValueResponse':
         """Create LookupValueResponse from domain model."""
-        return cls(
-            lookup_value_id=domain_model.lookup_value_id,
-            option_key=domain_model.option_key,
-            display_value=domain_model.display_value,
-            option_value=domain_model.option_value,
-            metadata=domain_model.metadata,
-            sort_order=domain_model.sort_order,
-            parent_id=domain_model.parent_id
-        )
+        # pydantic-core lee los atributos del dataclass directamente
+        return cls.model_validate(domain_model, from_attributes=True)
 
 
 class LookupValueSingleResponse(SuccessResponse[LookupValueResponse]):
@@ -112,10 +110,12 @@ class LookupValueSingleResponse(SuccessResponse[LookupValueResponse]):
     @classmethod
     def from_domain_model(cls, domain_model: LookupValueResult, category_code: str, option_value: str) -> 'LookupValueSingleResponse':
         """Create LookupValueSingleResponse from domain model."""
-        lookup_value = LookupValueResponse.from_domain_model(domain_model)
-        return cls(
-            data=lookup_value,
-            message=f"Retrieved lookup value for category {category_code} and option {option_value}"
+        return cls.model_validate(
+            {
+                "data": domain_model,
+                "message": f"Retrieved lookup value for category {category_code} and option {option_value}",
+            },
+            from_attributes=True,
         )
 
 
@@ -127,11 +127,16 @@ class LookupValuesResponse(SuccessResponse[List[LookupValueResponse]]):
     @classmethod
     def from_domain_models(cls, domain_models: List[LookupValueResult], category_code: str) -> 'LookupValuesResponse':
         """Create LookupValuesResponse from domain models."""
-        values = [LookupValueResponse.from_domain_model(model) for model in domain_models]
-        return cls(
-            data=values,
-            message=f"Retrieved {len(values)} lookup values for category {category_code}",
-            count=len(values)
+        # Una sola validación: la lista completa se recorre en pydantic-core, sin un
+        # LookupValueResponse construido desde Python por cada valor
+        count = len(domain_models)
+        return cls.model_validate(
+            {
+                "data": domain_models,
+                "message": f"Retrieved {count} lookup values for category {category_code}",
+                "count": count,
+            },
+            from_attributes=True,
         )
 
 #endregion
@@ -6,14 +6,6 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 
-"""Module schemas for request/response validation."""
-
-from datetime import datetime
-from typing import List, Optional
-
-from pydantic import BaseModel, ConfigDict, Field
-
-
 #region Base Schemas
 
 class ModuleBase(BaseModel):
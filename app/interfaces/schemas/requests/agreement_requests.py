@@ -1,5 +1,6 @@
 """Agreement request schemas for validation."""
 
+import re
 from datetime import date
 from decimal import Decimal
 from typing import List, Optional
@@ -8,6 +9,14 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from app.core.validators import validate_secure_string_advanced
 from app.core.agreement_enums import SourceSystemEnum
 
+# Patrones de los validadores, compilados una sola vez al importar
+_RE_ALNUM_DASH_UND = re.compile(r'^[a-zA-Z0-9\-_]+$')
+_RE_ALNUM_DASH_UND_DOT = re.compile(r'^[a-zA-Z0-9\-_\.]+$')
+_RE_DIGITS_DASH = re.compile(r'^[0-9\-]+$')
+_RE_ALNUM_UND = re.compile(r'^[a-zA-Z0-9_]+$')
+_RE_TEXT = re.compile(r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$')
+_RE_NAME = re.compile(r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$')
+
 
 class AgreementSearchRequest(BaseModel):
     """Schema for agreement search request parameters with business validation."""
@@ -177,7 +186,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="SKU code",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -193,7 +202,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$',
+            allowed_pattern=_RE_TEXT,
             field_name="Description",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -209,7 +218,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="SPF code",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -225,7 +234,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$',
+            allowed_pattern=_RE_TEXT,
             field_name="SPF description",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -241,7 +250,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[0-9\-]+$',
+            allowed_pattern=_RE_DIGITS_DASH,
             field_name="Supplier RUC",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -257,7 +266,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)\_\%\@]+$',
+            allowed_pattern=_RE_TEXT,
             field_name="Supplier name",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -273,7 +282,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9_]+$',
+            allowed_pattern=_RE_ALNUM_UND,
             field_name="PMM username",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -289,7 +298,7 @@ class AgreementSearchRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9_]+$',
+            allowed_pattern=_RE_ALNUM_UND,
             field_name="ID field",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -403,7 +412,7 @@ class AgreementProductCreateRequest(BaseModel):
         """Validate SKU code with security checks."""
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_\.]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND_DOT,
             field_name="SKU code",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -419,7 +428,7 @@ class AgreementProductCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[0-9\-]+$',
+            allowed_pattern=_RE_DIGITS_DASH,
             field_name="Supplier RUC",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -466,7 +475,7 @@ class AgreementExcludedFlagCreateRequest(BaseModel):
         """Validate excluded flag ID with security checks."""
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="Excluded flag ID",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -601,7 +610,7 @@ class AgreementCreateRequest(BaseModel):
             return None
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="Agreement type ID",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -614,7 +623,7 @@ class AgreementCreateRequest(BaseModel):
         """Validate ID fields with security checks."""
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="ID field",
             max_repeated_chars=2,
             normalize_whitespace=False,
@@ -633,7 +642,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$',
+            allowed_pattern=_RE_NAME,
             field_name="Description",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -652,7 +661,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$',
+            allowed_pattern=_RE_NAME,
             field_name="Activity name",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -671,7 +680,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9\-_]+$',
+            allowed_pattern=_RE_ALNUM_DASH_UND,
             field_name="SPF code",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -690,7 +699,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$',
+            allowed_pattern=_RE_NAME,
             field_name="SPF description",
             max_repeated_chars=4,
             normalize_whitespace=True,
@@ -706,7 +715,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9_]+$',
+            allowed_pattern=_RE_ALNUM_UND,
             field_name="PMM username",
             max_repeated_chars=3,
             normalize_whitespace=False,
@@ -722,7 +731,7 @@ class AgreementCreateRequest(BaseModel):
         
         return validate_secure_string_advanced(
             value=v,
-            allowed_pattern=r'^[a-zA-Z0-9_]+$',
+            allowed_pattern=_RE_ALNUM_UND,
             field_name="Store grouping ID",
             max_repeated_chars=2,
             normalize_whitespace=False,
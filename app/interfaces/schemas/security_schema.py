@@ -1,9 +1,12 @@
 """Security domain entities and enums."""
 
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Los claims llegan con alias ("vendors-taxs"); el código interno usa el nombre del campo
+_POPULATE_BY_NAME = ConfigDict(populate_by_name=True)
 
 
 class Roles(str, Enum):
@@ -19,6 +22,36 @@ class Roles(str, Enum):
     ACCESS_SELLOUT = 'ACCESS_SELLOUT'
 
 
+# Un bit por rol (asignado al importar) para comparar conjuntos de permisos como enteros;
+# la clave es el valor del rol, que es lo que guarda la base de datos
+ROLE_BITS: Dict[str, int] = {role.value: 1 << index for index, role in enumerate(Roles)}
+
+
+def roles_mask(roles: Iterable[str]) -> int:
+    """Bitmask of granted module names; names that are not roles grant nothing."""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
+def required_roles_mask(roles: Iterable[Union[Roles, str]]) -> int:
+    """
+    Bitmask of required roles.
+
+    Raises ValueError for any role without a bit: an unknown requirement must
+    never be satisfied by default.
+    """
+    mask = 0
+    for role in roles:
+        value = role.value if isinstance(role, Roles) else role
+        try:
+            mask |= ROLE_BITS[value]
+        except KeyError:
+            raise ValueError(f"Unknown required role: {role!r}") from None
+    return mask
+
+
 class VendorTaxOperation(BaseModel):
     """Vendor tax operation model."""
     
@@ -51,9 +84,7 @@ class User(BaseModel):
     country: Optional[str] = Field(None)
     bu: Optional[str] = Field(None)
 
-    class Config:
-        populate_by_name = True
-        allow_population_by_alias = True
+    model_config = _POPULATE_BY_NAME
 
 
 class TokenData(BaseModel):
@@ -73,9 +104,7 @@ class TokenData(BaseModel):
     country: Optional[str] = Field(None)
     bu: Optional[str] = Field(None)
 
-    class Config:
-        populate_by_name = True
-        allow_population_by_alias = True
+    model_config = _POPULATE_BY_NAME
 
 
 class ResponseValidToken(BaseModel):
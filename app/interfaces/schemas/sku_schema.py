@@ -1,14 +1,64 @@
 """SKU Pydantic schemas for validation."""
 
+import re
 from decimal import Decimal
-from typing import List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, field_validator
 
-from app.core.validators import validate_with_timing_protection
+from app.core.validators import GENERIC_NAMES, validate_with_timing_protection
+
+_RE_SKU_CODE = re.compile(r'^[a-zA-Z0-9]+$')
 
 
 #region Request Schemas
 
+def _validate_sku_codes(v: List[str]) -> List[str]:
+    """Validate SKU codes format with enhanced security validation."""
+    if not v:
+        raise ValueError("SKU codes list cannot be empty")
+    
+    # Validate each SKU code format with security checks
+    for sku_code in v:
+        if not sku_code or not isinstance(sku_code, str):
+            raise ValueError("All SKU codes must be non-empty strings")
+        
+        if not sku_code.strip():
+            raise ValueError("SKU codes cannot be empty or whitespace only")
+        
+        # Enhanced validation with security checks
+        try:
+            validated_code = validate_with_timing_protection(
+                value=sku_code.strip(),
+                field_name="SKU code",
+                min_length=3,
+                max_length=8,
+                allowed_chars=_RE_SKU_CODE,
+                generic_names=GENERIC_NAMES
+            )
+            
+            # Additional business validation
+            if len(validated_code) < 3 or len(validated_code) > 8:
+                raise ValueError("SKU codes must be between 3 and 8 characters")
+            
+            if not validated_code.isalnum():
+                raise ValueError("SKU codes must contain only alphanumeric characters")
+            
+        except Exception as e:
+            raise ValueError(f"Invalid SKU code '{sku_code}': {str(e)}")
+    
+    return [code.strip() for code in v]
+
+
+SkuCodeList = Annotated[
+    List[str],
+    Field(min_length=1, max_length=100),
+    AfterValidator(_validate_sku_codes),
+]
+
+# Built once at import; validates a raw list without a model instance per request
+SKU_CODES_ADAPTER: TypeAdapter[List[str]] = TypeAdapter(SkuCodeList)
+
+
 class SkuCodesRequest(BaseModel):
     """Request schema for getting SKUs by codes."""
     
@@ -24,39 +74,7 @@ class SkuCodesRequest(BaseModel):
     @classmethod
     def validate_sku_codes(cls, v):
         """Validate SKU codes format with enhanced security validation."""
-        if not v:
-            raise ValueError("SKU codes list cannot be empty")
-        
-        # Validate each SKU code format with security checks
-        for sku_code in v:
-            if not sku_code or not isinstance(sku_code, str):
-                raise ValueError("All SKU codes must be non-empty strings")
-            
-            if not sku_code.strip():
-                raise ValueError("SKU codes cannot be empty or whitespace only")
-            
-            # Enhanced validation with security checks
-            try:
-                validated_code = validate_with_timing_protection(
-                    value=sku_code.strip(),
-                    field_name="SKU code",
-                    min_length=3,
-                    max_length=8,
-                    allowed_chars=r'^[a-zA-Z0-9]+$',
-                    generic_names=['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
-                )
-                
-                # Additional business validation
-                if len(validated_code) < 3 or len(validated_code) > 8:
-                    raise ValueError("SKU codes must be between 3 and 8 characters")
-                
-                if not validated_code.isalnum():
-                    raise ValueError("SKU codes must contain only alphanumeric characters")
-                
-            except Exception as e:
-                raise ValueError(f"Invalid SKU code '{sku_code}': {str(e)}")
-        
-        return [code.strip() for code in v]
+        return _validate_sku_codes(v)
 
 #endregion
 
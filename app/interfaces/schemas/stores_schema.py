@@ -1,9 +1,10 @@
 """Store Pydantic schemas for validation."""
 
+import re
 from datetime import datetime
 from typing import Optional
 
-from app.core.validators import validate_with_timing_protection
+from app.core.validators import GENERIC_NAMES, validate_with_timing_protection
 from pydantic import (
     BaseModel,
     Field,
@@ -12,6 +13,10 @@ from pydantic import (
     model_validator,
 )
 
+# Patrones de nombres compilados una sola vez
+_RE_STORE_NAME = re.compile(r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$')
+_RE_ZONE_CHANNEL_NAME = re.compile(r'^[A-Za-z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.]+$')
+
 
 #region Base Schemas
 
@@ -65,8 +70,8 @@ class StoreBase(BaseModel):
             field_name="store_name",
             min_length=3,
             max_length=100,
-            allowed_chars=r'^[a-zA-Z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.\,\&\+\#\(\)]+$',
-            generic_names=['test', 'admin', 'root', 'user', 'demo', 'example', 'sample']
+            allowed_chars=_RE_STORE_NAME,
+            generic_names=GENERIC_NAMES
         )
 
     @field_validator('zone_name')
@@ -83,7 +88,7 @@ class StoreBase(BaseModel):
             field_name="zone_name",
             min_length=1,
             max_length=50,
-            allowed_chars=r'^[A-Za-z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.]+$'
+            allowed_chars=_RE_ZONE_CHANNEL_NAME
         )
         
         return sanitized if sanitized else None
@@ -102,7 +107,7 @@ class StoreBase(BaseModel):
             field_name="channel_name",
             min_length=1,
             max_length=50,
-            allowed_chars=r'^[A-Za-z0-9ñáéíóúüÁÉÍÓÚÜ\s\-\.]+$'
+            allowed_chars=_RE_ZONE_CHANNEL_NAME
         )
         
         return sanitized if sanitized else None
@@ -8,12 +8,13 @@ from app.core.logging import LoggerMixin, setup_logging
 from app.core.middleware import (
     general_exception_handler,
     http_exception_handler,
-    request_logging_middleware,
+    RequestLoggingMiddleware,
     validation_exception_handler,
     AuthMiddleware,
+    DbSessionMiddleware,
 )
 from app.core.app_lifespan import AppLifecycle
-from app.interfaces.api.routers import create_api_router
+from app.interfaces.api.routers import create_api_router, mount_api_router
 from app.interfaces.api.controllers.healthy_controller  import router as healthy_router 
 
 lifecycle = AppLifecycle()
@@ -43,6 +44,12 @@ class ApplicationManager(LoggerMixin):
         #endregion
 
         #region Middleware
+        # Public endpoints (health, docs): no authentication and no DB session
+        public_paths = ["/docs", "/redoc", "/openapi.json", "/status/health", "/"]
+
+        # Innermost: one DB session per request, shared by the repository dependencies
+        app.add_middleware(DbSessionMiddleware, exclude_paths=public_paths)
+
         # Add CORS middleware with secure configuration
         app.add_middleware(
             CORSMiddleware,
@@ -56,11 +63,11 @@ class ApplicationManager(LoggerMixin):
         # Add authentication middleware
         app.add_middleware(
             AuthMiddleware,
-            exclude_paths=["/docs", "/redoc", "/openapi.json", "/status/health", "/"]
+            exclude_paths=public_paths
         )
 
         # Add custom middleware in order
-        app.middleware("http")(request_logging_middleware)  # Log all requests
+        app.add_middleware(RequestLoggingMiddleware)  # Log all requests
 
         #endregion
 
@@ -70,7 +77,7 @@ class ApplicationManager(LoggerMixin):
         # # Include all routers using the centralized router system
         # # Each router now manages its own prefix (versioning)
         api_router = create_api_router()
-        app.include_router(api_router)   
+        mount_api_router(app, api_router)
 
         #endregion
 
@@ -13,7 +13,7 @@ async def test_get_skus_success():
     repo.get_skus_by_codes.return_value = ["SKU1", "SKU2"]
     user = DummyUser()
     # Llamar al método real de la clase, que usa get_skus_by_codes
-    result = await use_cases.get_skus_by_codes(type('SkuCodesRequest', (), {'sku_codes': ["SKU1", "SKU2"]})())
+    result = await use_cases.get_skus_by_codes(["SKU1", "SKU2"])
     assert result == ["SKU1", "SKU2"]
 
 @pytest.mark.asyncio
@@ -23,4 +23,4 @@ async def test_get_skus_error():
     repo.get_skus_by_codes.side_effect = Exception("fail")
     user = DummyUser()
     with pytest.raises(Exception):
-        await use_cases.get_skus_by_codes(type('SkuCodesRequest', (), {'sku_codes': ["SKU1"]})())
+        await use_cases.get_skus_by_codes(["SKU1"])
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.core.middleware import auth_middleware
+from app.core.middleware.auth_middleware import AuthMiddleware
+
+
+class DummyUser:
+    email = "test@example.com"
+
+
+@pytest.fixture
+def security(monkeypatch):
+    security = AsyncMock(return_value=DummyUser())
+    monkeypatch.setattr(auth_middleware, "security", security)
+    return security
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware, exclude_paths=["/status/health"])
+
+    @app.get("/status/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/me")
+    async def me(request: Request):
+        return {"email": request.state.user.email}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_sets_user_on_request_state(security):
+    response = _client().get("/me", headers={"country": "PE", "Authorization": "Bearer abc"})
+    assert response.status_code == 200
+    assert response.json() == {"email": "test@example.com"}
+    security.assert_awaited_once_with("PE", "Bearer abc")
+
+
+def test_missing_country_returns_422(security):
+    response = _client().get("/me")
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Missing country header"}
+    security.assert_not_awaited()
+
+
+def test_security_error_is_returned_as_response(security):
+    security.side_effect = HTTPException(status_code=401, detail="Token requerido.")
+    response = _client().get("/me", headers={"country": "PE"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Token requerido."}
+
+
+def test_excluded_path_skips_authentication(security):
+    response = _client().get("/status/health")
+    assert response.status_code == 200
+    security.assert_not_awaited()
@@ -0,0 +1,137 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.middleware import db_session
+from app.core.middleware.db_session import DbSessionMiddleware
+
+
+def _session_factory(session) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    factory.return_value.__aexit__.return_value = False
+    return factory
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = AsyncMock()
+    monkeypatch.setattr(db_session, "AsyncSessionLocal", _session_factory(session))
+    return session
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(DbSessionMiddleware)
+
+    @app.get("/ok")
+    async def ok(request: Request):
+        return {"has_session": request.state.db_session is not None}
+
+    @app.post("/write")
+    async def write(request: Request):
+        return {"has_session": request.state.db_session is not None}
+
+    @app.get("/not-found")
+    async def not_found():
+        raise HTTPException(status_code=404, detail="missing")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.post("/stream-boom")
+    async def stream_boom():
+        async def body():
+            yield b"partial"
+            raise RuntimeError("body failed")
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_commits_on_success(session):
+    response = _client().get("/ok")
+    assert response.status_code == 200
+    assert response.json() == {"has_session": True}
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+
+
+def test_rolls_back_on_error_response(session):
+    response = _client().get("/not-found")
+    assert response.status_code == 404
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited()
+
+
+def test_rolls_back_on_unhandled_exception(session):
+    response = _client().get("/boom")
+    assert response.status_code == 500
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited()
+
+
+def test_excluded_path_gets_no_session(session):
+    app = FastAPI()
+    app.add_middleware(DbSessionMiddleware, exclude_paths=["/status/health"])
+
+    @app.get("/status/health")
+    async def health(request: Request):
+        return {"has_session": hasattr(request.state, "db_session")}
+
+    response = TestClient(app).get("/status/health")
+    assert response.json() == {"has_session": False}
+    db_session.AsyncSessionLocal.assert_not_called()
+
+
+def test_get_uses_the_transactional_session(session):
+    # Reads keep their transaction: a GET that writes must not run in AUTOCOMMIT
+    _client().get("/ok")
+    db_session.AsyncSessionLocal.assert_called_once()
+    session.commit.assert_awaited_once()
+
+
+def test_post_uses_the_transactional_session(session):
+    response = _client().post("/write")
+    assert response.status_code == 200
+    db_session.AsyncSessionLocal.assert_called_once()
+    session.commit.assert_awaited_once()
+
+
+def test_body_failure_after_start_rolls_back_and_hides_the_status(session):
+    response = _client().post("/stream-boom")
+    # The 200 start message was never released: the client only sees the error
+    assert response.status_code == 500
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited()
+
+
+def test_commit_failure_is_reported_as_an_error(session):
+    session.commit.side_effect = RuntimeError("commit failed")
+    response = _client().post("/write")
+    assert response.status_code == 500
+    session.rollback.assert_awaited()
+
+
+def test_commit_happens_before_the_response_is_sent(session):
+    events = []
+    session.commit.side_effect = lambda: events.append("commit")
+    app = FastAPI()
+
+    @app.post("/write")
+    async def write():
+        return {"ok": True}
+
+    async def asgi(scope, receive, send):
+        async def recording_send(message):
+            events.append(message["type"])
+            await send(message)
+
+        await DbSessionMiddleware(app)(scope, receive, recording_send)
+
+    assert TestClient(asgi).post("/write").json() == {"ok": True}
+    assert events[:2] == ["commit", "http.response.start"]
@@ -0,0 +1,23 @@
+import sys
+
+from app.core.app_lifespan import AppLifecycle
+from app.interfaces.schemas.agreement_excluded_flag_schema import (
+    AgreementExcludedFlagCreateRequest,
+    AgreementExcludedFlagCreateResponse,
+)
+from app.interfaces.schemas.agreement_product_schema import AgreementProductCreateRequest
+
+
+def test_build_deferred_schemas_completes_request_models():
+    AppLifecycle()._build_deferred_schemas()
+
+    assert AgreementProductCreateRequest.__pydantic_complete__
+    assert AgreementExcludedFlagCreateRequest.__pydantic_complete__
+    assert AgreementExcludedFlagCreateResponse.__pydantic_complete__
+
+
+def test_build_deferred_schemas_keeps_lazy_exports_unloaded(monkeypatch):
+    monkeypatch.delitem(sys.modules, "app.interfaces.schemas.agreements_bulk_upload_schema", raising=False)
+    AppLifecycle()._build_deferred_schemas()
+
+    assert "app.interfaces.schemas.agreements_bulk_upload_schema" not in sys.modules
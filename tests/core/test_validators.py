@@ -0,0 +1,60 @@
+import pytest
+
+from app.core import validators
+from app.core.validators import validate_secure_string_advanced, validate_secure_strings_advanced
+
+
+@pytest.fixture(autouse=True)
+def no_timing_protection(monkeypatch):
+    monkeypatch.setattr(validators.UnifiedValidator, "_timing_attack_protection", lambda self, start_time: None)
+
+
+@pytest.fixture
+def sanitize_html(monkeypatch):
+    calls = []
+    original = validators.UnifiedValidator._sanitize_html
+
+    def spy(self, value):
+        calls.append(value)
+        return original(self, value)
+
+    monkeypatch.setattr(validators.UnifiedValidator, "_sanitize_html", spy)
+    return calls
+
+
+def test_plain_value_skips_sanitization(sanitize_html):
+    assert validate_secure_string_advanced("FLAG_01 a-b", max_repeated_chars=3) == "FLAG_01 a-b"
+    assert sanitize_html == []
+
+
+def test_plain_value_still_checks_sql_and_repetition(sanitize_html):
+    with pytest.raises(ValueError, match="SQL"):
+        validate_secure_string_advanced("DROP_TABLE")
+    with pytest.raises(ValueError, match="repeated"):
+        validate_secure_string_advanced("AAAA", max_repeated_chars=3)
+
+
+def test_non_plain_value_is_sanitized(sanitize_html):
+    assert validate_secure_string_advanced("SKU.01") == "SKU.01"
+    assert sanitize_html == ["SKU.01"]
+    with pytest.raises(ValueError, match="suspicious"):
+        validate_secure_string_advanced("a..b")
+
+
+def test_list_validation_uses_one_timing_window(monkeypatch):
+    windows = []
+    monkeypatch.setattr(validators.UnifiedValidator, "_timing_attack_protection", lambda self, start_time: windows.append(start_time))
+
+    assert validate_secure_strings_advanced([" D01", "D02"], normalize_whitespace=False) == ["D01", "D02"]
+    assert len(windows) == 1
+    with pytest.raises(ValueError, match="SQL"):
+        validate_secure_strings_advanced(["D01", "DROP_TABLE"])
+    assert len(windows) == 2
+
+
+def test_business_layer_flags_generic_names():
+    validator = validators.unified_validator
+
+    assert validator.validate_business_layer("Admin", "Name").warnings == ["Name is generic"]
+    assert validator.validate_business_layer("Admin", "Name", generic_names=frozenset({"other"})).warnings == []
+    assert validator.validate_business_layer("other", "Name", generic_names=frozenset({"other"})).warnings == ["Name is generic"]
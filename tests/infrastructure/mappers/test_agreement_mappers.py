@@ -4,7 +4,8 @@ from app.infrastructure.mappers import agreement_mappers
 
 
 from app.core.agreement_enums import SourceSystemEnum
-from datetime import date
+from datetime import date, datetime
+from sqlalchemy.engine.result import result_tuple
 from decimal import Decimal
 class DummyRow:
     def __init__(self):
@@ -75,6 +76,29 @@ def test_map_search_results_to_agreement_items():
     assert len(items) == 2
 
 
+def test_map_search_results_reads_sqlalchemy_rows_by_position():
+    source = vars(DummyRow())
+    source["created_at"] = datetime(2023, 1, 1)
+    source["updated_at"] = datetime(2023, 1, 2)
+    columns = ["total_count", *source]
+    make_row = result_tuple(columns)
+    rows = [make_row([2, *source.values()]), make_row([2, *source.values()])]
+
+    items = agreement_mappers.map_search_results_to_agreement_items(rows)
+
+    assert len(items) == 2
+    assert items[0].id == 1
+    assert items[0].description == "desc"
+    assert items[0].created_at == "2023-01-01T00:00:00"
+    assert items[0].supplier_ruc == "RUC1"
+
+    missing = result_tuple([c for c in columns if c != "status_id"])
+    with pytest.raises(AttributeError, match="status_id"):
+        agreement_mappers.map_search_results_to_agreement_items(
+            [missing([v for c, v in zip(columns, [2, *source.values()]) if c != "status_id"])]
+        )
+
+
 def test_map_request_to_agreement_product_success():
     req = MagicMock()
     req.sku_code = "SKU1"
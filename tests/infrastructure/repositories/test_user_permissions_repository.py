@@ -60,3 +60,17 @@ async def test_check_db_permissions_forbidden():
     with pytest.raises(HTTPException) as excinfo:
         await repo.check_db_permissions(user, [Roles.ACCESS_AGREEMENTS])
     assert excinfo.value.status_code == 403
+
+@pytest.mark.asyncio
+async def test_check_db_permissions_unknown_required_role_fails_closed():
+    session = MagicMock()
+    repo = UserPermissionsRepository(session)
+    user = MagicMock(bu_id=1, email="user@example.com")
+    repo.get_permissions_by_user = AsyncMock(return_value=[Roles.ACCESS_AGREEMENTS.value])
+    with pytest.raises(ValueError):
+        await repo.check_db_permissions(user, [Roles.ACCESS_AGREEMENTS, "UNKNOWN_ROLE"])
+
+def test_require_permissions_internal_rejects_unknown_role_at_registration():
+    from app.interfaces.dependencies.auth_dependencies import require_permissions_internal
+    with pytest.raises(ValueError):
+        require_permissions_internal(["UNKNOWN_ROLE"])
@@ -1,8 +1,14 @@
+import json
 import pytest
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException, status
-from app.interfaces.api.controllers.agreements_controller import AgreementController
-from app.interfaces.schemas.agreement_schema import AgreementCreateRequest, AgreementCreateResponse, AgreementSearchRequest, AgreementUpdateRequest, AgreementDetailResponse
+from app.interfaces.api.controllers.agreements_controller import (
+    AgreementController,
+    get_agreement_by_id as get_agreement_route,
+    search_agreements as search_agreements_route,
+)
+from app.interfaces.schemas.agreement_schema import AgreementCreateRequest, AgreementCreateResponse, AgreementSearchRequest, AgreementSearchResponse, AgreementSearchResultItem, AgreementUpdateRequest, AgreementDetailResponse
 from app.core.agreement_enums import SourceSystemEnum
 from app.core.response import SuccessResponse, PaginatedResponse
 from datetime import date, datetime
@@ -59,9 +65,11 @@ async def test_create_agreement_success():
         excluded_flags=[]
     )
     use_cases = AsyncMock()
-    use_cases.create_agreement.return_value = DummyAgreement()
+    agreement = DummyAgreement()
+    use_cases.create_agreement.return_value = agreement
     response = await controller.create_agreement(request, agreement_data, use_cases)
     assert response is not None
+    assert response == AgreementCreateResponse.from_domain_model(agreement)
 
 @pytest.mark.asyncio
 async def test_create_agreement_value_error():
@@ -100,6 +108,25 @@ async def test_search_agreements_success():
     assert response is not None
     assert response.pagination["total"] == 1
 
+@pytest.mark.asyncio
+async def test_search_route_serializes_paginated_response():
+    search_result = AgreementSearchResponse(
+        agreements=[AgreementSearchResultItem(
+            id=1, source_system=SourceSystemEnum.PMM, start_date=date(2026, 1, 2),
+            created_at="c", created_by_user_email="test@example.com", updated_at="u",
+            status_id="ACTIVE", rebate_type_id="REBATE", unit_price=Decimal("1.50"),
+        )],
+        total_count=1,
+    )
+    use_cases = AsyncMock()
+    use_cases.search_agreements.return_value = search_result
+    response = await search_agreements_route(DummyRequest(), AgreementSearchRequest(), use_cases)
+    body = json.loads(response.body)
+    assert response.media_type == "application/json"
+    assert body["pagination"]["total"] == 1
+    assert body["data"] == json.loads(search_result.model_dump_json())
+    assert body["data"]["agreements"][0]["unit_price"] == "1.50"
+
 @pytest.mark.asyncio
 async def test_search_agreements_value_error():
     controller = AgreementController()
@@ -132,6 +159,22 @@ async def test_get_agreement_by_id_success():
     response = await controller.get_agreement_by_id(request, 1, use_cases)
     assert response is not None
 
+@pytest.mark.asyncio
+async def test_get_agreement_route_serializes_detail():
+    agreement = DummyAgreement()
+    detail = AgreementDetailResponse(
+        **{name: getattr(agreement, name) for name in AgreementDetailResponse.model_fields if hasattr(agreement, name)}
+    )
+    use_cases = AsyncMock()
+    use_cases.get_agreement_by_id.return_value = detail
+    response = await get_agreement_route(DummyRequest(), 1, use_cases)
+    body = json.loads(response.body)
+    assert response.media_type == "application/json"
+    assert body["success"] is True
+    assert body["data"] == json.loads(detail.model_dump_json())
+    assert body["data"]["unit_price"] == "10.0"
+    assert body["data"]["start_date"] == agreement.start_date.isoformat()
+
 @pytest.mark.asyncio
 async def test_get_agreement_by_id_value_error():
     controller = AgreementController()
@@ -52,3 +52,13 @@ async def test_get_skus_error():
     use_cases.get_skus_by_codes.side_effect = Exception("fail")
     with pytest.raises(HTTPException):
         await controller.get_skus_by_codes(request, "SKU1", use_cases)
+
+@pytest.mark.asyncio
+async def test_get_skus_invalid_codes():
+    controller = SkuController()
+    request = DummyRequest()
+    use_cases = AsyncMock()
+    with pytest.raises(HTTPException) as excinfo:
+        await controller.get_skus_by_codes(request, "S!", use_cases)
+    assert excinfo.value.status_code == 400
+    use_cases.get_skus_by_codes.assert_not_called()
@@ -61,6 +61,12 @@ async def test_get_store_by_id_invalid_id():
     with pytest.raises(HTTPException) as excinfo:
         await controller.get_store_by_id(request, 0, use_cases)
     assert excinfo.value.status_code == 400
+    assert excinfo.value.detail == {"success": False, "message": "Invalid store ID", "data": None}
+    # Each exception carries its own mutable copy of the shared payload
+    excinfo.value.detail["message"] = "changed"
+    with pytest.raises(HTTPException) as excinfo:
+        await controller.get_store_by_id(request, 0, use_cases)
+    assert excinfo.value.detail["message"] == "Invalid store ID"
 
 # Test error handling in get_active_stores
 @pytest.mark.asyncio
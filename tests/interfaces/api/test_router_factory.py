@@ -0,0 +1,47 @@
+import pytest
+
+from app.interfaces.api.routers import router_config
+from app.interfaces.api.routers.router_factory import RouterFactory
+
+
+@pytest.fixture
+def factory():
+    return RouterFactory()
+
+
+def test_validation_cache_is_read_only(factory):
+    validation = factory.validate_router_configuration()
+
+    with pytest.raises(TypeError):
+        validation["valid"] = False
+    assert isinstance(validation["missing_implementations"], tuple)
+    assert isinstance(factory.get_all_implemented_routers(), tuple)
+    assert factory.validate_router_configuration() is validation
+
+
+def test_configured_names_change_only_on_registration(factory):
+    names = router_config.get_configured_router_names()
+    assert router_config.get_configured_router_names() is names
+
+    router_config.add_router_config("router_factory_probe", "/probe", ["probe"], "Probe router")
+    try:
+        assert "router_factory_probe" in router_config.get_configured_router_names()
+        assert "router_factory_probe" in factory.validate_router_configuration()["missing_implementations"]
+    finally:
+        router_config.remove_router_config("router_factory_probe")
+
+    assert router_config.get_configured_router_names() == names
+    assert "router_factory_probe" not in factory.validate_router_configuration()["missing_implementations"]
+
+
+def test_reenabled_router_keeps_its_configured_order():
+    enabled = router_config.get_enabled_routers()
+    first = enabled[0]
+
+    router_config.update_router_config(first, enabled=False)
+    try:
+        assert first not in router_config.get_enabled_routers()
+    finally:
+        router_config.update_router_config(first, enabled=True)
+
+    assert router_config.get_enabled_routers() == enabled
@@ -0,0 +1,35 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.interfaces.dependencies.agreement_dependencies import (
+    AgreementUseCasesDep,
+    get_agreement_repository,
+)
+from app.interfaces.dependencies.stores_dependencies import (
+    StoreUseCasesDep,
+    get_store_repository,
+)
+
+
+class FakeRepository:
+    pass
+
+
+def test_repository_overrides_reach_use_cases():
+    app = FastAPI()
+    fake = FakeRepository()
+
+    @app.get("/agreements")
+    async def agreements(use_cases: AgreementUseCasesDep):
+        return {"overridden": use_cases._agreement_repository is fake}
+
+    @app.get("/stores")
+    async def stores(use_cases: StoreUseCasesDep):
+        return {"overridden": use_cases._store_repository is fake}
+
+    app.dependency_overrides[get_agreement_repository] = lambda: fake
+    app.dependency_overrides[get_store_repository] = lambda: fake
+    client = TestClient(app)
+
+    assert client.get("/agreements").json() == {"overridden": True}
+    assert client.get("/stores").json() == {"overridden": True}